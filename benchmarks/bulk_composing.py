@@ -0,0 +1,63 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+import timeit
+
+from pytraits import add_traits, compile_traits
+from pytraits.core import TraitFactory
+from pytraits.core.composing.compiler import Compiler
+
+
+# Trait with 200 methods composed into class having 100 subclasses. Every
+# assignment to a class invalidates attribute cache of all its subclasses.
+MEMBERS = 200
+SUBCLASSES = 100
+namespace = {"__name__": __name__}
+exec("class ManyMethods:\n" + "".join(
+    "    def method_{0}(self):\n        return {0}\n".format(number)
+    for number in range(MEMBERS)), namespace)
+ManyMethods = namespace["ManyMethods"]
+Composer = TraitFactory["Composer"]
+
+
+def create_target():
+    target = type("Target", (), {})
+    target.subclasses = [type("Sub{}".format(number), (target, ), {})
+                         for number in range(SUBCLASSES)]
+    return target
+
+
+def compose_one_by_one():
+    # Composing one member at a time, as done before bulk composing.
+    target = TraitFactory["TraitTargetInspector"](create_target())
+    resolutions = TraitFactory["Resolutions"]({})
+    for source in TraitFactory["Traits"]((ManyMethods, )):
+        Composer(target, source).compose(resolutions)
+
+
+def compose_bulk():
+    add_traits(create_target(), ManyMethods)
+
+
+def report(title, statement, number=20):
+    seconds = min(timeit.repeat(statement, number=number, repeat=5))
+    print("{:<30} {:8.2f} ms/composition".format(title, seconds / number * 1e3))
+
+
+if __name__ == "__main__":
+    Compiler.set_cache_size(4096)
+    before = Composer.stats().get("class_mutations", 0)
+    compose_bulk()
+    print("class mutations per composition: {}".format(
+        Composer.stats()["class_mutations"] - before))
+
+    report("one by one (before)", compose_one_by_one)
+    report("bulk", compose_bulk)
+
+    # Applying compiled plan again to same class finds the members in place.
+    target = create_target()
+    plan = compile_traits(ManyMethods)
+    plan.apply(target)
+    before = Composer.stats()["class_mutations"]
+    report("plan applied again", lambda: plan.apply(target))
+    print("class mutations when applied again: {}".format(
+        Composer.stats()["class_mutations"] - before))
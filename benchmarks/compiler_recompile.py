@@ -0,0 +1,50 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+import sys
+import timeit
+
+from pytraits.core.composing.compiler import Compiler
+
+
+# Trait function with a mix of public and private names, so that the compiler
+# has something to rewrite.
+class ExampleTrait:
+    def method(self, value):
+        return self.public + self._hidden + self.__private + value
+
+
+ExampleTarget = type("ExampleTarget", (), {})
+NUMBER = 20000
+
+
+def report(title, statement):
+    seconds = min(timeit.repeat(statement, number=NUMBER, repeat=5))
+    print("{:<40} {:8.3f} us/function".format(title, seconds / NUMBER * 1e6))
+
+
+if __name__ == "__main__":
+    # Measure the compiling itself, not the cache.
+    Compiler.set_cache_size(0)
+    compiler = Compiler()
+    code = ExampleTrait.method.__code__
+    names = compiler._transfer_names(code.co_names, ExampleTarget)
+
+    # Positional reconstruction of CodeType only works up to Python 3.10, newer
+    # versions have changed the constructor signature.
+    if sys.version_info[:2] < (3, 11):
+        report("CodeType(*fields) (before)",
+               lambda: compiler._rebuild_code(code, co_names=names, co_name="renamed"))
+    else:
+        print("CodeType(*fields) (before)               not supported on this version")
+
+    if hasattr(code, "replace"):
+        report("code.replace() (after)",
+               lambda: compiler._replace_code(code, co_names=names, co_name="renamed"))
+
+    function = ExampleTrait.method
+    report("Compiler.recompile, uncached",
+           lambda: compiler.recompile(function, ExampleTarget, "renamed"))
+
+    Compiler.set_cache_size(256)
+    report("Compiler.recompile, cached",
+           lambda: compiler.recompile(function, ExampleTarget, "renamed"))
@@ -0,0 +1,37 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+import timeit
+
+from pytraits import type_safe, type_converted
+from pytraits.support.magic import validation
+
+
+# Decorating is done when modules are imported, so this is the cost added to
+# startup of program having 10000 decorated functions.
+NUMBER = 10000
+FUNCTIONS = []
+
+
+def create_functions():
+    for number in range(NUMBER):
+        namespace = {}
+        exec("def function_{0}(value: int, answer: bool, anything, *, flag: int=0):\n"
+             "    return value\n".format(number), namespace)
+        FUNCTIONS.append(namespace["function_{}".format(number)])
+
+
+def decorate_all(decorator):
+    for function in FUNCTIONS:
+        decorator(function)
+
+
+def report(title, decorator):
+    seconds = min(timeit.repeat(lambda: decorate_all(decorator), number=1, repeat=3))
+    print("{:<30} {:8.1f} ms/{} functions".format(title, seconds * 1e3, NUMBER))
+
+
+if __name__ == "__main__":
+    create_functions()
+    report("type_safe", type_safe)
+    report("type_converted", type_converted)
+    report("validation", validation)
@@ -0,0 +1,48 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+import os
+import re
+import subprocess
+import sys
+
+
+# Import times measured with 'python -X importtime'. Primitives are registered
+# from static list, while scanning the package with pkgutil (as done before) can
+# still be enabled with PYTRAITS_PRIMITIVES. Top level package imports its
+# public names only when they are accessed.
+REPEAT = 10
+
+
+def import_time(module, statement="import pytraits.core", **environment):
+    environment = dict(os.environ, **environment)
+    timings = []
+    for _ in range(REPEAT):
+        output = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                                env=environment, stderr=subprocess.PIPE, check=True).stderr
+        total = 0
+        for line in output.decode().splitlines():
+            match = re.match(r"import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)$", line)
+            if match and module is None and len(match.group(3)) == 1:
+                total += int(match.group(2))
+            elif match and match.group(4) == module:
+                total = int(match.group(2))
+        timings.append(total)
+    return min(timings)
+
+
+def report(title, **environment):
+    primitives = import_time("pytraits.core.primitives", **environment)
+    total = import_time("pytraits.core", **environment)
+    print("{:<30} {:8} us primitives, {:8} us pytraits.core".format(title, primitives, total))
+
+
+def report_total(statement):
+    print("{:<40} {:8} us".format(statement, import_time(None, statement)))
+
+
+if __name__ == "__main__":
+    report("pkgutil scan (before)", PYTRAITS_PRIMITIVES="pytraits.core.primitives")
+    report("static registry")
+    report_total("import pytraits")
+    report_total("import pytraits; pytraits.Singleton")
+    report_total("import pytraits; pytraits.add_traits")
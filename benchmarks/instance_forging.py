@@ -0,0 +1,44 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+import timeit
+
+from pytraits import setproperty
+
+
+# Each property composed into an instance requires the class of the instance
+# to be forged. Forging must happen only once per instance, otherwise every
+# property adds one more class to the hierarchy and slows down attribute
+# lookups of the instance.
+class Example:
+    def __init__(self):
+        self.value = 42
+
+
+def getter(self):
+    return self.value
+
+
+PROPERTIES = 200
+NUMBER = 200000
+
+
+def lookup_latency(instance):
+    seconds = min(timeit.repeat(lambda: instance.value, number=NUMBER, repeat=5))
+    return seconds / NUMBER * 1e9
+
+
+if __name__ == "__main__":
+    instance = Example()
+    setproperty(instance, getter, name="property_0")
+    depth, latency = len(type(instance).__mro__), lookup_latency(instance)
+    print("after {:>4} properties: MRO depth {}, lookup {:6.1f} ns".format(1, depth, latency))
+
+    for index in range(1, PROPERTIES):
+        setproperty(instance, getter, name="property_{}".format(index))
+
+    final_depth, final_latency = len(type(instance).__mro__), lookup_latency(instance)
+    print("after {:>4} properties: MRO depth {}, lookup {:6.1f} ns".format(
+        PROPERTIES, final_depth, final_latency))
+
+    assert final_depth == depth, "Forging is not idempotent!"
+    assert final_latency < latency * 2, "Attribute lookups got slower!"
@@ -0,0 +1,42 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+import timeit
+
+from pytraits import add_traits
+from pytraits.core.composing.compiler import Compiler
+
+
+# Trait with 200 methods using private attributes, so that each of them must
+# be recompiled for the target. Lazily composed methods are compiled only when
+# accessed, so startup cost depends on the number of methods used.
+MEMBERS = 200
+namespace = {"__name__": __name__}
+exec("class ManyMethods:\n" + "".join(
+    "    def method_{0}(self):\n        return self.__value + {0}\n".format(number)
+    for number in range(MEMBERS)), namespace)
+ManyMethods = namespace["ManyMethods"]
+
+
+def compose(lazy, used):
+    target = type("Target", (), {"_Target__value": 0})
+    add_traits(target, ManyMethods, lazy=lazy)
+    instance = target()
+    for number in range(used):
+        getattr(instance, "method_{}".format(number))()
+
+
+def report(title, statement, number=20):
+    seconds = min(timeit.repeat(statement, number=number, repeat=5))
+    print("{:<35} {:8.2f} ms/composition".format(title, seconds / number * 1e3))
+
+
+if __name__ == "__main__":
+    # Measure the compiling itself, not the cache.
+    cache_size = Compiler.cache_info().maxsize
+    Compiler.set_cache_size(0)
+    try:
+        for used in (0, 10, MEMBERS):
+            report("eager, {} methods used".format(used), lambda: compose(False, used))
+            report("lazy, {} methods used".format(used), lambda: compose(True, used))
+    finally:
+        Compiler.set_cache_size(cache_size)
@@ -0,0 +1,37 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+import tracemalloc
+
+from pytraits import add_traits
+from pytraits.core import TraitFactory
+
+
+# Memory allocated for each member of a trait with 1000 methods. Traits are
+# classified into primitive objects, which are kept alive while composing.
+MEMBERS = 1000
+namespace = {"__name__": __name__}
+exec("class ManyMethods:\n" + "".join(
+    "    def method_{0}(self):\n        return {0}\n".format(number)
+    for number in range(MEMBERS)), namespace)
+ManyMethods = namespace["ManyMethods"]
+Traits = TraitFactory["Traits"]
+
+
+def measure(title, function):
+    # Warm up caches, so that only memory of the work itself is measured.
+    function()
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = function()
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    print("{:<30} {:8.1f} bytes/member retained, {:8.1f} bytes/member peak".format(
+        title, (after - before) / MEMBERS, (peak - before) / MEMBERS))
+
+
+if __name__ == "__main__":
+    measure("classifying members", lambda: list(Traits((ManyMethods, ))))
+    measure("composing to class", lambda: add_traits(type("Target", (), {}), ManyMethods))
@@ -0,0 +1,50 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+import timeit
+
+from pytraits import Singleton
+from pytraits.support.errors import SingletonError
+
+
+# Previous implementation, which stored the instance to attribute shared with
+# subclasses and created it without locking.
+class PreviousSingleton(type):
+    def __call__(self, *args, **kwargs):
+        try:
+            return self.__instance
+        except AttributeError:
+            def immutable_object(*args):
+                raise SingletonError()
+
+            self.__instance = super().__call__(*args, **kwargs)
+            self.__setitem__ = immutable_object
+            self.__setattr__ = immutable_object
+            return self.__instance
+
+
+class Previous(metaclass=PreviousSingleton):
+    pass
+
+
+class Current(metaclass=Singleton):
+    pass
+
+
+class Plain:
+    pass
+
+
+NUMBER = 1000000
+
+
+def report(title, statement):
+    seconds = min(timeit.repeat(statement, number=NUMBER, repeat=5))
+    print("{:<30} {:8.1f} ns/call".format(title, seconds / NUMBER * 1e9))
+
+
+if __name__ == "__main__":
+    Previous()
+    Current()
+    report("previous Singleton", Previous)
+    report("Singleton", Current)
+    report("plain class", Plain)
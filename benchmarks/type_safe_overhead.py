@@ -0,0 +1,43 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+import timeit
+
+from pytraits import type_safe, type_converted
+
+
+# Call overhead of type_safe compared to calling the function directly. Checks
+# are generated when function is decorated, so each call runs only plain
+# isinstance checks.
+def plain(value: int, answer: bool, anything):
+    return value
+
+
+checked = type_safe(plain)
+converted = type_converted(plain)
+
+
+class Example:
+    def plain(self, value: int, answer: bool, anything):
+        return value
+
+    @type_safe
+    def checked(self, value: int, answer: bool, anything):
+        return value
+
+
+instance = Example()
+NUMBER = 200000
+
+
+def report(title, statement):
+    seconds = min(timeit.repeat(statement, number=NUMBER, repeat=5))
+    print("{:<30} {:8.1f} ns/call".format(title, seconds / NUMBER * 1e9))
+
+
+if __name__ == "__main__":
+    report("function", lambda: plain(1, True, None))
+    report("type_safe function", lambda: checked(1, True, None))
+    report("method", lambda: instance.plain(1, True, None))
+    report("type_safe method", lambda: instance.checked(1, True, None))
+    report("type_converted, exact types", lambda: converted(1, True, None))
+    report("type_converted, converting", lambda: converted("1", "true", None))
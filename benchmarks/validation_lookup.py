@@ -0,0 +1,43 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+import timeit
+
+from pytraits.support.magic import validation, Interval
+
+
+# Validation of argument against 1000 allowed values. Values are stored into
+# frozenset when function is decorated, so the lookup does not depend on
+# position of the value among the allowed ones.
+ALLOWED = tuple("command_{}".format(number) for number in range(1000))
+
+
+@validation
+def dispatch(command: ALLOWED):
+    return command
+
+
+@validation
+def percentage(value: Interval(0, 100)):
+    return value
+
+
+@validation
+def even(value: range(0, 2000, 2)):
+    return value
+
+
+NUMBER = 100000
+
+
+def report(title, statement):
+    seconds = min(timeit.repeat(statement, number=NUMBER, repeat=5))
+    print("{:<40} {:8.1f} ns/call".format(title, seconds / NUMBER * 1e9))
+
+
+if __name__ == "__main__":
+    report("tuple scan, first value (before)", lambda: ALLOWED[0] in ALLOWED)
+    report("tuple scan, last value (before)", lambda: ALLOWED[-1] in ALLOWED)
+    report("validation, first value", lambda: dispatch(ALLOWED[0]))
+    report("validation, last value", lambda: dispatch(ALLOWED[-1]))
+    report("validation, interval", lambda: percentage(50))
+    report("validation, range", lambda: even(1998))
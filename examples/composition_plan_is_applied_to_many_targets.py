@@ -0,0 +1,41 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+from pytraits import compile_traits
+
+
+# Let's create a trait which accesses private attributes of the object it is
+# going to be composed into.
+class Greeting:
+    def greet(self):
+        return "Hello, " + self.__name
+
+    @property
+    def name(self):
+        return self.__name
+
+
+# When same traits are composed into many objects, the composition can be
+# prepared once and then applied to each of them. Classification of traits,
+# conflict resolutions and compiling are done only once per kind of target.
+plan = compile_traits(Greeting, greet="say_hello")
+
+
+class Person:
+    def __init__(self, name):
+        self.__name = name
+
+
+first = Person("Alice")
+second = Person("Bob")
+
+plan.apply(first)
+plan.apply(second)
+
+assert first.say_hello() == "Hello, Alice", "Plan fails with first instance!"
+assert second.say_hello() == "Hello, Bob", "Plan fails with second instance!"
+assert first.name == "Alice", "Plan fails with property in instance!"
+assert not hasattr(Person("Carol"), "say_hello"), "Plan has modified the class!"
+
+# Plans can also be applied to classes.
+plan.apply(Person)
+assert Person("Carol").say_hello() == "Hello, Carol", "Plan fails with class!"
@@ -16,12 +16,24 @@
    limitations under the License.
 '''
 
-from pytraits.support import Singleton, Factory, type_safe, type_converted
-from pytraits.combiner import combine_class
-from pytraits.extendable import extendable
-from pytraits.setproperty import setproperty
-from pytraits.trait_composer import add_traits
+from pytraits.support.lazy import lazy_import
 
 __version__ = "1.2.1"
 __all__ = ["Singleton", "Factory", "combine_class", "extendable", "add_traits",
-           "type_safe", "type_converted", "setproperty"]
+           "compile_traits", "type_safe", "type_converted", "setproperty"]
+
+# Modules of public names. Module is imported when the name is accessed first
+# time, so that using only Singleton or type_safe does not import the whole
+# trait machinery.
+_MODULES = {"Singleton": "pytraits.support",
+            "Factory": "pytraits.support",
+            "type_safe": "pytraits.support",
+            "type_converted": "pytraits.support",
+            "combine_class": "pytraits.combiner",
+            "extendable": "pytraits.extendable",
+            "setproperty": "pytraits.setproperty",
+            "add_traits": "pytraits.trait_composer",
+            "compile_traits": "pytraits.trait_composer"}
+
+
+lazy_import(globals(), _MODULES)
@@ -19,15 +19,18 @@
 from pytraits.trait_composer import add_traits
 
 
-def combine_class(class_name: str, *traits, **resolved_conflicts):
+def combine_class(class_name: str, *traits, lazy=False, policy=None, **resolved_conflicts):
     """ This function composes new class out of any number of traits.
 
     Args:
         class_name: Name of the new class.
         traits: Collection of traits, such as functions, classes or instances.
+        lazy: When True, methods are compiled when they are accessed first time.
+        policy: What to do when names of traits collide, see Resolutions.
 
     Keyword Args:
-        name of trait (str): new name
+        name of trait (str): new name. Traits named 'lazy' or 'policy' can't
+                             be renamed, since those are taken by arguments.
 
     Example of combining multiple classes to one:
 
@@ -48,7 +51,7 @@ def combine_class(class_name: str, *traits, **resolved_conflicts):
     'Combination'
     """
     NewClass = type(class_name, (object,), {})
-    add_traits(NewClass, *traits)
+    add_traits(NewClass, *traits, lazy=lazy, policy=policy, **resolved_conflicts)
     return NewClass
 
 
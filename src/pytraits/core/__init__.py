@@ -5,4 +5,7 @@ from .base import TraitFactory
 from .primitives.trait_object import TraitObject
 import pytraits.core.composing  # NOQA
 
+# Everything is registered now, allow modules to bind what they need.
+TraitFactory.freeze()
+
 __all__ = ["TraitObject", "TraitFactory"]
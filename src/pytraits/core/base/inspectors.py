@@ -35,6 +35,10 @@ class TraitInspector(metaclass=Singleton):
     def __call__(self, object):
         return self.__inspector.inspect(object)
 
+    def inspect_many(self, objects):
+        """ Identifies all objects in one pass. @see Inspector.inspect_many """
+        return self.__inspector.inspect_many(objects)
+
     @classmethod
     def add_hook(cls, name, hook):
         cls().__inspector.add_hook(name, hook)
@@ -18,5 +18,6 @@
 
 import pytraits.core.composing.compiler  # NOQA
 import pytraits.core.composing.resolutions  # NOQA
-import pytraits.core.composing.traits  # NOQA
 import pytraits.core.composing.composer  # NOQA
+import pytraits.core.composing.traits  # NOQA
+import pytraits.core.composing.plan  # NOQA
@@ -19,11 +19,78 @@
 import types
 import collections
 import sys
+import threading
 
 from pytraits.support import is_sysname
 from pytraits.core import TraitFactory
 
 
+CacheInfo = collections.namedtuple("CacheInfo", "hits misses maxsize currsize")
+
+
+class CodeCache:
+    """ Bounded least-recently-used store for recompiled code objects.
+
+    Entries are keyed by the source code object and strings only, so the
+    cache never holds a reference to target classes or instances. Setting
+    the size to zero disables caching altogether.
+
+    >>> cache = CodeCache(maxsize=2)
+    >>> cache.put("a", 1); cache.put("b", 2); cache.get("a")
+    1
+    >>> cache.put("c", 3)
+    >>> cache.get("b") is None
+    True
+    >>> cache.info()
+    CacheInfo(hits=1, misses=1, maxsize=2, currsize=2)
+    """
+    def __init__(self, maxsize=256):
+        self.__entries = collections.OrderedDict()
+        self.__lock = threading.Lock()
+        self.__maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """ Returns cached value for the key or None, if it is not found. """
+        with self.__lock:
+            try:
+                value = self.__entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """ Stores value, evicting least recently used entries when full. """
+        with self.__lock:
+            if self.__maxsize <= 0:
+                return
+            self.__entries[key] = value
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__maxsize:
+                self.__entries.popitem(last=False)
+
+    def resize(self, maxsize):
+        """ Changes the maximum number of entries kept in the cache. """
+        with self.__lock:
+            self.__maxsize = maxsize
+            while len(self.__entries) > max(maxsize, 0):
+                self.__entries.popitem(last=False)
+
+    def clear(self):
+        """ Removes all entries and resets the counters. """
+        with self.__lock:
+            self.__entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.__maxsize, len(self.__entries))
+
+
 @TraitFactory.register
 class Compiler:
     """
@@ -34,39 +101,127 @@ class Compiler:
     object, as if it was written there in the first place. This is because internals
     of the function are read-only and we need to change them in order to access
     private attributes.
+
+    Recompiled code objects are cached and shared by all compilers, since
+    the same trait is very often composed into many targets of same name.
+    The cache is keyed by the original code object and its file name, the
+    name used for mangling private attributes and the resolved name of the
+    trait. File name is needed, since code objects compare equal regardless
+    of the file they were compiled from.
+
+    Functions not referring to any private attributes do not need to be
+    recompiled at all (zero-copy). Those are either used as they are or
+    renamed once and shared by all targets.
     """
-    def _clone_function(self, function):
+    # Shared among all compiler instances, since every trait object creates
+    # its own compiler.
+    CACHE = CodeCache()
+    STATS = collections.Counter()
+    ZERO_COPY = True
+
+    def _clone_code(self, code):
         trait = collections.OrderedDict()
 
-        trait["co_argcount"] = function.__code__.co_argcount
-        trait["co_kwonlyargcount"] = function.__code__.co_kwonlyargcount
-        if sys.version_info[:2] >= (3, 8) :
-          trait["co_posonlyargcount"] = function.__code__.co_posonlyargcount
-        trait["co_nlocals"] = function.__code__.co_nlocals
-        trait["co_stacksize"] = function.__code__.co_stacksize
-        trait["co_flags"] = function.__code__.co_flags
-        trait["co_code"] = function.__code__.co_code
-        trait["co_consts"] = function.__code__.co_consts
-        trait["co_names"] = function.__code__.co_names
-        trait["co_varnames"] = function.__code__.co_varnames
-        trait["co_filename"] = function.__code__.co_filename
-        trait["co_name"] = function.__code__.co_name
-        trait["co_firstlineno"] = function.__code__.co_firstlineno
-        trait["co_lnotab"] = function.__code__.co_lnotab
+        trait["co_argcount"] = code.co_argcount
+        if sys.version_info[:2] >= (3, 8):
+            trait["co_posonlyargcount"] = code.co_posonlyargcount
+        trait["co_kwonlyargcount"] = code.co_kwonlyargcount
+        trait["co_nlocals"] = code.co_nlocals
+        trait["co_stacksize"] = code.co_stacksize
+        trait["co_flags"] = code.co_flags
+        trait["co_code"] = code.co_code
+        trait["co_consts"] = code.co_consts
+        trait["co_names"] = code.co_names
+        trait["co_varnames"] = code.co_varnames
+        trait["co_filename"] = code.co_filename
+        trait["co_name"] = code.co_name
+        trait["co_firstlineno"] = code.co_firstlineno
+        trait["co_lnotab"] = code.co_lnotab
+        trait["co_freevars"] = code.co_freevars
+        trait["co_cellvars"] = code.co_cellvars
 
         return trait
 
-    def _transfer_names(self, trait, clazz):
+    def _transfer_names(self, names, clazz):
         items = []
-        for name in trait["co_names"]:
+        for name in names:
             if "__" not in name or is_sysname(name):
                 items.append(name)
             else:
                 items.append("_%s%s" % (clazz.__name__, name[name.index('__'):]))
-        trait["co_names"] = tuple(items)
+        return tuple(items)
+
+    def _needs_mangling(self, code):
+        """ Checks if code object or any code nested in it has private names. """
+        if any("__" in name and not is_sysname(name) for name in code.co_names):
+            return True
+        return any(self._needs_mangling(const) for const in code.co_consts
+                   if isinstance(const, types.CodeType))
 
-    def _compile_trait(self, trait, globs):
-        return types.FunctionType(types.CodeType(*trait.values()), globs)
+    def _is_named(self, code, name):
+        if code.co_name != name:
+            return False
+        return getattr(code, "co_qualname", name) == name
+
+    def _rebuild_code(self, code, **changes):
+        """ Builds new code object by passing every field to CodeType.
+
+        Used with Python versions where code objects can not be replaced.
+        Positional signature of CodeType changes between versions, thus this
+        works only up to Python 3.10.
+        """
+        trait = self._clone_code(code)
+        trait.update(changes)
+        return types.CodeType(*trait.values())
+
+    def _replace_code(self, code, **changes):
+        """ Copies code object changing only given fields.
+
+        All other fields, including line number tables, are kept as they are
+        so that tracebacks point to original source lines.
+        """
+        if "co_name" in changes and sys.version_info[:2] >= (3, 11):
+            changes["co_qualname"] = changes["co_name"]
+        return code.replace(**changes)
+
+    if sys.version_info[:2] >= (3, 8):
+        _compile_code = _replace_code
+    else:
+        _compile_code = _rebuild_code
+
+    def _mangle_code(self, code, clazz, **changes):
+        """ Compiles code object and all code nested in it against clazz. """
+        consts = tuple(self._mangle_nested(const, clazz)
+                       if isinstance(const, types.CodeType) else const
+                       for const in code.co_consts)
+        return self._compile_code(code,
+                                  co_names=self._transfer_names(code.co_names, clazz),
+                                  co_consts=consts,
+                                  **changes)
+
+    def _mangle_nested(self, code, clazz):
+        """ Compiles nested code, like lambdas and comprehensions.
+
+        Nested code keeps its name, thus it is cached by mangling name only
+        and shared among all traits composed into classes of same name.
+        """
+        if not self._needs_mangling(code):
+            return code
+
+        key = (code, code.co_filename, clazz.__name__, None)
+        compiled = self.CACHE.get(key)
+        if compiled is None:
+            compiled = self._mangle_code(code, clazz)
+            self.CACHE.put(key, compiled)
+        return compiled
+
+    def _create_function(self, code, function):
+        """ Creates function of given code, keeping everything else from original function. """
+        compiled = types.FunctionType(code, function.__globals__, None,
+                                      function.__defaults__, function.__closure__)
+        if function.__kwdefaults__:
+            compiled.__kwdefaults__ = dict(function.__kwdefaults__)
+        return compiled
 
     def recompile(self, function, target, name: str=""):
         """
@@ -76,11 +231,46 @@ class Compiler:
         @param target: Target class or instance
         @param {str} name: New name for the target
         """
-        trait = self._clone_function(function)
-        self._transfer_names(trait, target)
-        trait["co_name"] = name or trait["co_name"].strip('<>')
+        code = function.__code__
+        name = name or code.co_name.strip('<>')
+
+        if self.ZERO_COPY and not self._needs_mangling(code):
+            self.STATS["zero_copy"] += 1
+            if self._is_named(code, name):
+                return self._create_function(code, function)
+
+            # Renamed clone does not depend on target, so it is shared.
+            key = (code, code.co_filename, "", name)
+            compiled = self.CACHE.get(key)
+            if compiled is None:
+                compiled = self._compile_code(code, co_name=name)
+                self.CACHE.put(key, compiled)
+            return self._create_function(compiled, function)
+
+        self.STATS["recompiled"] += 1
+        key = (code, code.co_filename, target.__name__, name)
+        compiled = self.CACHE.get(key)
+        if compiled is None:
+            compiled = self._mangle_code(code, target, co_name=name)
+            self.CACHE.put(key, compiled)
+
+        return self._create_function(compiled, function)
+
+    @classmethod
+    def cache_info(cls):
+        """ Returns hits, misses and size of the recompilation cache. """
+        return cls.CACHE.info()
+
+    @classmethod
+    def set_cache_size(cls, maxsize):
+        """ Sets maximum number of cached code objects. Zero disables cache. """
+        cls.CACHE.resize(maxsize)
 
-        return self._compile_trait(trait, function.__globals__)
+    @classmethod
+    def clear_cache(cls):
+        """ Empties the recompilation cache and resets its counters. """
+        cls.CACHE.clear()
+        cls.STATS.clear()
 
 
 if __name__ == "__main__":
@@ -16,8 +16,18 @@
    limitations under the License.
 '''
 
-from pytraits.support import type_safe
+import collections
+
 from pytraits.core import TraitFactory, TraitObject
+from pytraits.core.primitives.class_object import ClassObject
+from pytraits.core.primitives.instance_object import InstanceObject
+from pytraits.core.primitives.property_object import PropertyObject
+from pytraits.core.primitives.routine_object import (RoutineObject, MethodObject,
+                                                     ClassMethodObject, StaticMethodObject,
+                                                     BuiltinObject)
+
+Compiler = None
+TraitFactory.bind_names(globals(), Compiler="Compiler")
 
 
 @TraitFactory.register
@@ -35,30 +45,115 @@ class Composer:
     be able to call the function.
     """
     # Dictionary of registered composers. Each composer is identified by
-    # two strings (target type names) as a key and all composers are added here
-    # by ComposerMeta metaclass.
+    # two primitive classes (target and source) as a key and all composers are
+    # added here by ComposerMeta metaclass.
     __COMPOSERS = dict()
 
+    # Composers selected for each pair of primitive classes met so far,
+    # including subclasses of registered primitives.
+    __DISPATCH = dict()
+
+    # Counters of work done by composers, see stats.
+    STATS = collections.Counter()
+
     @classmethod
     def register(cls, key, composer):
         """ Stores composer with given key for the future use. """
         cls.__COMPOSERS[key] = composer
+        cls.__DISPATCH.clear()
+
+    @staticmethod
+    def stats():
+        """ Returns counters describing the work done during compositions.
+
+        Keys:
+            zero_copy: Functions used without recompiling their code.
+            recompiled: Functions recompiled to mangle private names.
+            class_mutations: Assignments done to existing classes.
+            lazy_bound: Lazily composed traits bound on their first access.
+        """
+        stats = dict(Compiler.STATS)
+        stats.update(Composer.STATS)
+        return stats
+
+    def compose_many(self, target, sources, resolutions, lazy=False):
+        """ Composes all sources to target in one batch.
+
+        All sources are compiled before anything is bound to the target and
+        members are bound with one call per kind of composer. This way each
+        member is set only once and forged classes are created with all of
+        their members.
+
+        Args:
+            target: Target primitive.
+            sources: Source primitives.
+            resolutions: Resolutions used to name the traits.
+            lazy: When True, traits are compiled on their first access when possible.
+
+        Returns:
+            (list) composers used, name and compiled trait for each source.
+        """
+        steps = [self(target, source) for source in sources]
+        if lazy:
+            steps = [(composer, ) + composer.defer(resolutions) for composer in steps]
+        else:
+            steps = [(composer, ) + composer.compile(resolutions) for composer in steps]
 
-    @type_safe
-    def __call__(self, target: TraitObject, source: TraitObject):
+        # Traits ignored by resolutions don't have a name.
+        steps = [step for step in steps if step[1] is not None]
+        self.bind_many(target, steps)
+        return steps
+
+    @staticmethod
+    def bind_many(target, steps):
+        """ Binds compiled traits to target grouped by their composers.
+
+        Args:
+            target: Target primitive.
+            steps: Sequence of composer, name and compiled trait.
+        """
+        groups = collections.OrderedDict()
+        for step in steps:
+            groups.setdefault(type(step[0]), []).append(step)
+
+        for composer, group in groups.items():
+            composer.bind_many(target, group)
+
+    @classmethod
+    def __select(cls, target_type, source_type):
+        """ Finds composer for pair of primitive classes.
+
+        Composer registered for the closest base classes is used, target
+        classes are preferred over source classes.
+        """
+        for target_base in target_type.__mro__:
+            for source_base in source_type.__mro__:
+                composer = cls.__COMPOSERS.get((target_base, source_base))
+                if composer is not None:
+                    return composer
+        return None
+
+    def __call__(self, target, source):
         """ Factory method that selects correct composer for target and source. """
-        # Each TraitObject has a string representation that can be used to
-        # select correct composer.
-        joined = str(target), str(source)
+        key = type(target), type(source)
         try:
-            return self.__COMPOSERS[joined](target, source)
+            composer = self.__DISPATCH[key]
         except KeyError:
+            composer = self.__DISPATCH[key] = self.__select(*key)
+
+        if composer is None:
+            for name, value in (("target", target), ("source", source)):
+                if not isinstance(value, TraitObject):
+                    raise TypeError("Composer expected {} to be TraitObject, got '{}'".format(
+                        name, type(value).__name__))
+
             msg = "{target} '{targetqname}' and {source} '{sourceqname}' is not supported combination!"
             msg = msg.format(target=str(target),
                              targetqname=target.qualname,
                              source=str(source),
                              sourceqname=source.qualname)
             raise TypeError(msg)
+        return composer(target, source)
 
 
 class ComposerMeta(type):
@@ -73,12 +168,12 @@ class ComposerMeta(type):
         for support in getattr(cls, "CAN_COMPOSE", ()):
             Composer.register(support, cls)
 
-    @type_safe
-    def __call__(cls, target: TraitObject, source: TraitObject):
+    def __call__(cls, target, source):
         """ Initializes class instance.
 
         This function is roughly equivalent to class.__init__. Here we
-        initialize the composer object.
+        initialize the composer object. Composers are created only by
+        Composer factory, which has already checked the arguments.
         """
         instance = super().__call__()
         instance.target = target
@@ -86,16 +181,57 @@ class ComposerMeta(type):
         return instance
 
 
+@TraitFactory.register
+class LazyTrait:
+    """ Placeholder of trait in class, compiling and binding the trait on first access.
+
+    Placeholder replaces itself with the bound trait, thus following accesses
+    go directly to the trait. This way only traits that are used get compiled.
+    Primitives resolve placeholders when listing members of classes, so
+    lazily composed classes can be used as traits too.
+    """
+    def __init__(self, composer, name):
+        self.__composer = composer
+        self.__name = name
+        self.__trait = None
+
+    def resolve(self):
+        """ Compiles and binds the trait, unless done already, and returns it. """
+        if self.__trait is None:
+            composer = self.__composer
+            compiled = composer.source.recompile(composer.target, self.__name)
+            self.__trait = composer.source.rebind(composer.target, compiled)
+            Composer.STATS["lazy_bound"] += 1
+
+        # Placeholder may have already been replaced by another thread or
+        # by user while it was being looked up.
+        clazz = self.__composer.target.compile_target
+        if clazz.__dict__.get(self.__name) is self:
+            setattr(clazz, self.__name, self.__trait)
+            Composer.STATS["class_mutations"] += 1
+        return self.__trait
+
+    def __get__(self, instance, owner):
+        # Placeholder can be reached through other classes too, thus the
+        # trait is bound here as if it was found from the class itself.
+        trait = self.resolve()
+        try:
+            get = type(trait).__get__
+        except AttributeError:
+            return trait
+        return get(trait, instance, owner)
+
+
 class BasicComposer(metaclass=ComposerMeta):
     """ Basic composer for simple types.
 
     This class handles composition of most of the target - source pairs.
     """
-    CAN_COMPOSE = [('class', 'method'), ('instance', 'method'),
-                   ('class', 'classmethod'), ('instance', 'classmethod'),
-                   ('class', 'staticmethod'), ('instance', 'staticmethod'),
-                   ('class', 'builtin'), ('instance', 'builtin'),
-                   ('class', 'property')]
+    CAN_COMPOSE = [(ClassObject, MethodObject), (InstanceObject, MethodObject),
+                   (ClassObject, ClassMethodObject), (InstanceObject, ClassMethodObject),
+                   (ClassObject, StaticMethodObject), (InstanceObject, StaticMethodObject),
+                   (ClassObject, BuiltinObject), (InstanceObject, BuiltinObject),
+                   (ClassObject, PropertyObject)]
 
     def compose(self, resolutions):
         """ Composes trait to target object.
@@ -105,15 +241,54 @@ class BasicComposer(metaclass=ComposerMeta):
             - Compile trait against the target (as if it was written to it.)
             - Bind the compiled trait to target.
         """
-        name = resolutions.resolve(self.source.name)
-        compiled = self.source.recompile(self.target, name)
-        bound = self.source.rebind(self.target, compiled)
-        self.target[name] = bound
+        self.bind(*self.compile(resolutions))
+
+    def compile(self, resolutions):
+        """ Resolves the name and compiles trait against the target.
+
+        Returns:
+            (tuple) name and compiled trait, which can be given to bind.
+        """
+        name = resolutions.resolve(self.source.name, self.source.qualname)
+        if name is None:
+            return None, None
+        return name, self.source.recompile(self.target, name)
+
+    def defer(self, resolutions):
+        """ Resolves the name and creates placeholder compiling the trait on first access.
+
+        Only routines composed to classes can be deferred, any other trait is
+        compiled right away.
+
+        Returns:
+            (tuple) name and placeholder or compiled trait, which can be given to bind.
+        """
+        if not isinstance(self.target, ClassObject) or not isinstance(self.source, RoutineObject):
+            return self.compile(resolutions)
+
+        name = resolutions.resolve(self.source.name, self.source.qualname)
+        if name is None:
+            return None, None
+        return name, LazyTrait(self, name)
+
+    def bind(self, name, compiled):
+        """ Binds compiled trait to target with given name. """
+        if name is not None:
+            self.bind_many(self.target, [(self, name, compiled)])
+
+    @staticmethod
+    def bind_many(target, steps):
+        """ Binds compiled traits to target with one update. """
+        # Placeholders bind the trait themselves when they are accessed.
+        members = [(name, compiled if isinstance(compiled, LazyTrait)
+                    else composer.source.rebind(target, compiled))
+                   for composer, name, compiled in steps]
+        Composer.STATS["class_mutations"] += target.update(members)
 
 
 class Property2Instance(metaclass=ComposerMeta):
     """ Special handling for composing properties to instances. """
-    CAN_COMPOSE = [('instance', 'property')]
+    CAN_COMPOSE = [(InstanceObject, PropertyObject)]
 
     def compose(self, resolutions):
         """ Composes property trait to instance target.
@@ -126,14 +301,30 @@ class Property2Instance(metaclass=ComposerMeta):
         will go to any other instance of that class too. That's why, we create
         a clone of the class and set it to instance.
         """
-        # Modify target instance so that changing its class content won't
-        # affect other classes.
-        self.target.forge()
+        self.bind(*self.compile(resolutions))
+
+    def defer(self, resolutions):
+        """ Properties of instances are always compiled right away. """
+        return self.compile(resolutions)
 
-        # Resolve the name and recompile
-        name = resolutions.resolve(self.source.name)
-        compiled = self.source.recompile(self.target, name)
+    def compile(self, resolutions):
+        """ Resolves the name and compiles property against the target. """
+        name = resolutions.resolve(self.source.name, self.source.qualname)
+        if name is None:
+            return None, None
+        return name, self.source.recompile(self.target, name)
 
-        # Assing property to instance's class.
-        # TODO: Figure out pretty way to do this by calling target's function.
-        setattr(self.target.compile_target, name, compiled)
+    def bind(self, name, compiled):
+        """ Assigns compiled property to forged class of the instance. """
+        if name is not None:
+            self.bind_many(self.target, [(self, name, compiled)])
+
+    @staticmethod
+    def bind_many(target, steps):
+        """ Assigns compiled properties to forged class of the instance at once. """
+        # Modify target instance so that changing its class content won't
+        # affect other classes. Forged class keeps the name of original
+        # class, thus compiling before forging gives the same result.
+        members = [(name, compiled, composer.source.identity)
+                   for composer, name, compiled in steps]
+        Composer.STATS["class_mutations"] += target.forge_members(members)
@@ -0,0 +1,93 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+'''
+   Copyright 2014-2015 Teppo Perä
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+'''
+
+from pytraits.core import TraitFactory
+
+TraitTarget = Traits = Resolutions = Composer = None
+TraitFactory.bind_names(globals(),
+                        TraitTarget="TraitTargetInspector",
+                        Traits="Traits",
+                        Resolutions="Resolutions",
+                        Composer="Composer")
+
+
+@TraitFactory.register
+class CompositionPlan:
+    """ Composition of traits prepared once and applied to many targets.
+
+    Traits are classified when the plan is created. Composers, names and
+    compiled traits are selected when the plan is applied first time to a
+    target of certain kind and they are reused for every other target of
+    same kind. Compiled traits depend only on the name of target's class,
+    so the plan does not keep targets alive.
+
+    >>> class ExampleTrait:
+    ...     def __init__(self):
+    ...         self.__value = 42
+    ...
+    ...     def value(self):
+    ...         return self.__value
+    ...
+    >>> plan = CompositionPlan.create((ExampleTrait.value, ), {})
+    >>> class Example:
+    ...     def __init__(self):
+    ...         self.__value = 42
+    ...
+    >>> plan.apply(Example)
+    >>> Example().value()
+    42
+    """
+    def __init__(self, sources, resolutions, policy=None):
+        self.__sources = sources
+        self.__resolutions = resolutions
+        self.__policy = policy
+        self.__steps = {}
+
+    @classmethod
+    def create(cls, traits, resolutions, policy=None):
+        return cls(list(Traits(traits)), resolutions, policy)
+
+    def __compile(self, target):
+        # Conflicts are checked only between the traits, since steps are
+        # shared by all targets of same kind.
+        resolutions = Resolutions(self.__resolutions, self.__policy)
+        steps = []
+        for source in self.__sources:
+            composer = Composer(target, source)
+            name, compiled = composer.compile(resolutions)
+            if name is not None:
+                steps.append((type(composer), source, name, compiled))
+        return steps
+
+    def apply(self, target):
+        """ Binds traits of this plan to given class or instance. """
+        target = TraitTarget(target)
+        key = str(target), target.compile_target.__name__
+
+        try:
+            steps = self.__steps[key]
+        except KeyError:
+            steps = self.__steps[key] = self.__compile(target)
+
+        Composer.bind_many(target, [(composer(target, source), name, compiled)
+                                    for composer, source, name, compiled in steps])
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
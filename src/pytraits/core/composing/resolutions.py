@@ -16,6 +16,7 @@
    limitations under the License.
 '''
 
+from pytraits.support.errors import TraitConflictError
 from pytraits.core import TraitFactory
 
 
@@ -27,24 +28,83 @@ class Resolutions:
     every situation should be handled by user at the same time the traits
     are composed. That will guarantee that class or instance will behave
     as expected in every situation.
+
+    Names are collected into a table as traits are resolved, so each name is
+    checked against names of the target and traits resolved before it with
+    single lookup. What happens on collision depends on the policy:
+        LAST: Trait resolved later replaces the earlier one (default).
+        FIRST: Member found first is kept and later traits are ignored.
+        ERROR: TraitConflictError is raised.
+
+    >>> resolutions = Resolutions({"renamed": "other"}, policy=Resolutions.ERROR)
+    >>> resolutions.index(["existing"])
+    >>> resolutions.resolve("original", "first trait"), resolutions.resolve("renamed", "second trait")
+    ('original', 'other')
+    >>> resolutions.names
+    {'original': 'first trait', 'other': 'second trait'}
+    >>> resolutions.resolve("existing", "third trait")
+    Traceback (most recent call last):
+    ...
+    pytraits.support.errors.TraitConflictError: Name 'existing' of 'third trait' is already used by target
     """
-    def __init__(self, resolutions):
+    LAST, FIRST, ERROR = "last", "first", "error"
+    POLICIES = (LAST, FIRST, ERROR)
+
+    # Policy used, when none is given.
+    POLICY = LAST
+
+    def __init__(self, resolutions, policy=None):
         self.__resolutions = resolutions
+        self.__policy = policy or self.POLICY
+        if self.__policy not in self.POLICIES:
+            msg = "Unknown policy '{}', expected one of: {}"
+            raise ValueError(msg.format(self.__policy, ", ".join(self.POLICIES)))
+        self.__existing = frozenset()
+        self.__names = {}
+
+    @property
+    def policy(self):
+        return self.__policy
+
+    def index(self, names):
+        """ Stores names already found from target to be checked for conflicts. """
+        self.__existing = frozenset(names)
 
-    def resolve(self, name):
+    @property
+    def names(self):
+        """ Dictionary of names resolved so far and sources given for them. """
+        return dict(self.__names)
+
+    def resolve(self, name, source=None):
         """ Resolves name that shall be used for trait being composed.
 
-        NOTE: Currently it is possible to rename traits but collisions are
-              not checked.
+        Args:
+            name: Original name of the trait.
+            source: Object identifying the trait in name table and errors.
 
         Returns:
             (string) name of the trait
             (NoneType) nothing is returned in case trait should be ignored
 
         Raises:
-            Error if there is a conflict but no resolution.
+            TraitConflictError if there is a conflict and policy is ERROR.
         """
-        return self.__resolutions.get(name, name)
+        name = self.__resolutions.get(name, name)
+        if name is None:
+            return None
+
+        if name in self.__names or name in self.__existing:
+            if self.__policy == self.FIRST:
+                return None
+
+            if self.__policy == self.ERROR:
+                owner = "'{}'".format(self.__names[name]) if name in self.__names else "target"
+                msg = "Name '{}' of '{}' is already used by {}".format(name, source, owner)
+                raise TraitConflictError(msg)
+
+        self.__names[name] = source
+        return name
+
 
 if __name__ == "__main__":
     import doctest
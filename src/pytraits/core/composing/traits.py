@@ -18,13 +18,16 @@
 
 import inspect
 
-from pytraits.support import flatten, type_converted
+from pytraits.support import flatten
 from pytraits.support.errors import (FirstTraitArgumentError,
                                      TraitArgumentTypeError)
 from pytraits.core import TraitFactory
 
-TraitSource = TraitFactory["TraitSourceInspector"]
-Resolutions = TraitFactory["Resolutions"]
+TraitSource = Resolutions = Composer = None
+TraitFactory.bind_names(globals(),
+                        TraitSource="TraitSourceInspector",
+                        Resolutions="Resolutions",
+                        Composer="Composer")
 
 
 @TraitFactory.register
@@ -87,8 +90,27 @@ class Traits:
         for trait in flatten(map(TraitSource, self.__traits)):
             yield trait
 
-    @type_converted
-    def compose(self, target, resolutions: Resolutions):
-        """ Compose trait sources to target using composer. """
-        for source in self:
-            TraitFactory["Composer"](target, source).compose(resolutions)
+    def compose(self, target, resolutions, policy=None, lazy=False):
+        """ Compose trait sources to target using composer.
+
+        Args:
+            target: Target primitive.
+            resolutions: Dictionary of names to be used for traits.
+            policy: Policy for conflicting names, see Resolutions.
+            lazy: Compile traits composed to classes on their first access.
+
+        Returns:
+            (dict) names composed to target and qualified names of their traits.
+        """
+        resolutions = Resolutions(resolutions, policy)
+
+        # Members of the target are replaced anyway with the default policy,
+        # so they need to be listed only when they may be kept or reported.
+        # Names are read without accessing members, so that lazily composed
+        # traits of the target are not compiled.
+        if resolutions.policy != Resolutions.LAST:
+            names = set(dir(target.compile_target))
+            names.update(getattr(target.bind_target, "__dict__", ()))
+            resolutions.index(names)
+        Composer.compose_many(target, self, resolutions, lazy)
+        return resolutions.names
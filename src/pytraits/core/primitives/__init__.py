@@ -16,31 +16,69 @@
    limitations under the License.
 '''
 
-import pkgutil
-import importlib
-from os.path import dirname
+import os
 from pytraits.support import is_sysname
 from ..base.inspectors import TraitSourceInspector, TraitTargetInspector
+from .class_object import ClassObject
+from .instance_object import InstanceObject
+from .property_object import PropertyObject
+from .routine_object import (BuiltinObject, ClassMethodObject, FunctionObject,
+                             MethodObject, StaticMethodObject)
+from .unidentified_object import UnidentifiedObject
 
-# Import each module and register their TraitObject based classes to
-# corresponsing inspectors. This mechanism allows us to add new modules and
-# classes without need to do any other steps to get them registered into
-# inspectors.
-for _, module_name, _ in pkgutil.iter_modules([dirname(__file__)]):
-    module = importlib.import_module("{}.{}".format(__package__, module_name))
+# Primitives registered to inspectors. New primitive needs to be added here,
+# unless it is provided by a plugin package (see below).
+PRIMITIVES = (ClassObject, InstanceObject, PropertyObject, BuiltinObject,
+              ClassMethodObject, FunctionObject, MethodObject, StaticMethodObject,
+              UnidentifiedObject)
 
-    for object_name in dir(module):
-        if is_sysname(object_name):
-            continue
 
-        object = getattr(module, object_name)
+def hook_into_inspectors(objects):
+    """ Registers each given TraitObject based class to corresponding inspectors.
 
+    Objects not being primitives or not meant to be used by inspectors are
+    ignored.
+    """
+    for object in objects:
         try:
             object.hook_into(TraitSourceInspector)
             object.hook_into(TraitTargetInspector)
         except AttributeError:
             pass
 
+
+def scan(package):
+    """ Imports each module of given package and registers primitives found from them.
+
+    This mechanism allows plugins to add new modules and classes without need
+    to do any other steps to get them registered into inspectors. Scanning
+    has to be done while pytraits is imported, see PYTRAITS_PRIMITIVES, thus
+    plugins need to import TraitObject from pytraits.core.primitives.trait_object.
+    """
+    # Imported only when needed, since pkgutil alone slows down the import
+    # of pytraits considerably.
+    import pkgutil
+    import importlib
+
+    package = importlib.import_module(package)
+    modules = [package]
+    for _, module_name, _ in pkgutil.iter_modules(getattr(package, "__path__", [])):
+        modules.append(importlib.import_module("{}.{}".format(package.__name__, module_name)))
+
+    for module in modules:
+        hook_into_inspectors(getattr(module, object_name)
+                             for object_name in dir(module)
+                             if not is_sysname(object_name))
+
+
+hook_into_inspectors(PRIMITIVES)
+
+# Packages of additional primitives can be given as comma separated list in
+# environment variable PYTRAITS_PRIMITIVES. They are scanned for primitives
+# while inspectors can still be modified.
+for package in filter(None, os.environ.get("PYTRAITS_PRIMITIVES", "").split(",")):
+    scan(package.strip())
+
 # Let's remove the option of modifying the singletons after we are done with
 # this.
 TraitTargetInspector.add_hook = None
@@ -16,19 +16,18 @@
    limitations under the License.
 '''
 
-
-from pytraits.support import is_sysname
 from .trait_object import TraitObject
-from ..base import TraitFactory
 
 
 class ClassObject(TraitObject):
+    __slots__ = ()
+
     INSPECTORS = ('source', 'target')
 
     def __iter__(self):
         """ Yields each element in the class. """
-        for name, object in self.items():
-            sub = TraitFactory["TraitSourceInspector"](object)
+        objects = [object for name, object in self.items()]
+        for sub in self.TRAIT_SOURCE.inspect_many(objects):
             if sub:
                 yield sub
 
@@ -42,7 +41,24 @@ class ClassObject(TraitObject):
         setattr(self._object, key, value)
 
     def items(self):
-        return ((k, v) for (k, v) in self._object.__dict__.items() if not is_sysname(k))
+        return self._members(self._object.__dict__)
+
+    def update(self, members):
+        """ Sets many members to the class in one pass.
+
+        Every assignment to a class invalidates the attribute cache of the
+        class and all its subclasses, thus members already in place are not
+        assigned again and each name is assigned only once, last value winning.
+
+        Returns:
+            (int) number of assignments done to the class.
+        """
+        current = self._object.__dict__
+        changed = [(name, value) for name, value in dict(members).items()
+                   if name not in current or current[name] is not value]
+        for name, value in changed:
+            setattr(self._object, name, value)
+        return len(changed)
 
     @property
     def compile_target(self):
@@ -16,18 +16,25 @@
    limitations under the License.
 '''
 
-from pytraits.support import is_sysname
+import weakref
+
 from .trait_object import TraitObject
-from ..base import TraitFactory
 
 
 class InstanceObject(TraitObject):
+    __slots__ = ()
+
     INSPECTORS = ('source', 'target')
 
+    # When enabled, instances of the same class receiving the same members
+    # share a single forged class instead of each getting own one.
+    INTERN_FORGED = False
+    __INTERNED = weakref.WeakValueDictionary()
+
     def __iter__(self):
         """ Yields each element in the class. """
-        for name, object in self.items():
-            sub = TraitFactory["TraitSourceInspector"](object)
+        objects = [object for name, object in self.items()]
+        for sub in self.TRAIT_SOURCE.inspect_many(objects):
             if sub:
                 yield sub
 
@@ -43,6 +50,11 @@ class InstanceObject(TraitObject):
     def __setitem__(self, key, value):
         self._object.__dict__[key] = value
 
+    def update(self, members):
+        """ Sets many members to the instance. Returns number of assignments done to classes. """
+        self._object.__dict__.update(members)
+        return 0
+
     @property
     def compile_target(self):
         return self._object.__class__
@@ -55,9 +67,9 @@ class InstanceObject(TraitObject):
         items = dict()
         items.update(self._object.__class__.__dict__)
         items.update(self._object.__dict__)  # Makes sure that instance values override class values.
-        return ((k, v) for (k, v) in items.items() if not is_sysname(k))
+        return self._members(items)
 
-    def forge(self):
+    def forge(self, members=None):
         """ Modifies instance's class to be unique.
 
         This method creates a clone of instance's class and replaces the
@@ -68,14 +80,88 @@ class InstanceObject(TraitObject):
         This is mainly needed to make properties and other descriptors work
         so that they can be instance specific. They normally work only on classes
 
+        Args:
+            members: Dictionary of members to be set to the forged class.
+
+        Returns:
+            (int) number of assignments done to existing classes.
         """
+        members = members or {}
+
         # In case the object's class is already forged, no need to do it again.
-        if not hasattr(self._object, '__instance_forged'):
+        # Classes forged for single instance are marked with None, while
+        # classes shared by interning hold their members and must not be
+        # modified. Marker is looked up only from the class itself, since
+        # classes inherited from forged class are not forged.
+        original_class = self._object.__class__
+        if original_class.__dict__.get('__pytraits_forged__', False) is not None:
             # Retrieve the class of the object and create new class inherited
-            # from it. It can be used on this instance again.
-            original_class = self._object.__class__
-            new_class = type(original_class.__name__, (original_class, ), {})
-            new_class.__instance_forged = True
+            # from it. New class gets all members when it is created, thus it
+            # is never modified afterwards.
+            attrs = dict(members)
+            attrs['__pytraits_forged__'] = None
+            new_class = type(original_class.__name__, (original_class, ), attrs)
 
             # Replace the class with forged class.
             self._object.__class__ = new_class
+            return 0
+
+        for name, value in members.items():
+            setattr(original_class, name, value)
+        return len(members)
+
+    def forge_member(self, name, value, identity):
+        """ Sets class level member, like a property, only for this instance.
+
+        Args:
+            name: Name of the member in class.
+            value: Compiled member.
+            identity: Object identifying the trait the member is created from.
+        """
+        self.forge_members([(name, value, identity)])
+
+    def forge_members(self, members):
+        """ Sets many class level members only for this instance at once.
+
+        Args:
+            members: Sequence of name, compiled member and identity of the
+                     trait the member is created from.
+
+        Returns:
+            (int) number of assignments done to existing classes.
+        """
+        if self.INTERN_FORGED:
+            self.__intern(members)
+            return 0
+        return self.forge(dict((name, value) for name, value, _ in members))
+
+    def __intern(self, new_members):
+        """ Moves instance to forged class shared with other instances.
+
+        Forged classes are identified by the original class and traits composed
+        into it. Every member is kept in '__pytraits_forged__' dictionary of
+        the forged class, so that adding more members to already forged
+        instance creates a class inheriting directly from the original class,
+        keeping the class hierarchy flat. Forged classes are held weakly, thus
+        they are collected along with the last instance using them.
+        """
+        clazz = self._object.__class__
+        members = clazz.__dict__.get('__pytraits_forged__')
+        if members is None:
+            original, members = clazz, {}
+        else:
+            original, members = clazz.__bases__[0], dict(members)
+
+        for name, value, identity in new_members:
+            members[name] = (identity, value)
+        key = original, frozenset((n, i) for n, (i, _) in members.items())
+
+        try:
+            forged = self.__INTERNED[key]
+        except KeyError:
+            attrs = dict((n, v) for n, (_, v) in members.items())
+            attrs['__pytraits_forged__'] = members
+            forged = type(original.__name__, (original, ), attrs)
+            self.__INTERNED[key] = forged
+
+        self._object.__class__ = forged
@@ -20,18 +20,25 @@ from .trait_object import TraitObject
 
 
 class PropertyObject(TraitObject):
+    __slots__ = ("__name", )
+
     INSPECTORS = ('source',)
 
     def __init__(self, property, name=None):
-        self.__property = property
+        super().__init__(property)
         self.__name = name
-        self.__compiler = self.FACTORY["Compiler"]()
-        self.__inspector = self.FACTORY["TraitSourceInspector"]
 
     def get_func(self, func_name):
-        func = getattr(self.__property, func_name, None)
+        func = getattr(self._object, func_name, None)
         if func:
-            return self.__inspector(func)
+            return self.TRAIT_SOURCE(func)
+
+    @property
+    def identity(self):
+        """ Properties are identified by their functions, since 'setproperty'
+        creates a new property object on every call. """
+        return tuple(getattr(func, '__func__', func) for func in
+                     (self._object.fget, self._object.fset, self._object.fdel))
 
     @property
     def name(self):
@@ -28,6 +28,8 @@ class FunctionObject(TraitObject):
     pure functions for class should be staticmethods since they are not likely to
     do any modifications to class (or instance) itself.
     """
+    __slots__ = ()
+
     @classmethod
     def hook_into(cls, inspector):
         if inspector.TYPE == 'source':
@@ -56,6 +58,8 @@ class FunctionObject(TraitObject):
 
 
 class RoutineObject(TraitObject):
+    __slots__ = ()
+
     @property
     def name(self):
         return get_func_name(self._object, False)
@@ -71,6 +75,8 @@ class RoutineObject(TraitObject):
 class MethodObject(RoutineObject):
     """ This class encapsulates handling of methods.
     """
+    __slots__ = ()
+
     INSPECTORS = ('source',)
 
     def rebind(self, target, source):
@@ -86,6 +92,8 @@ class ClassMethodObject(RoutineObject):
     This class is able handle functions that are decorated with classmethod
     and pure functions that have 'cls' as a first argument.
     """
+    __slots__ = ()
+
     INSPECTORS = ('source',)
 
     @property
@@ -99,6 +107,8 @@ class ClassMethodObject(RoutineObject):
 class StaticMethodObject(RoutineObject):
     """ This class encapsulates handling of staticmethods.
     """
+    __slots__ = ()
+
     INSPECTORS = ('source',)
 
     @property
@@ -118,6 +128,8 @@ def wrap_builtin(builtin_func):
 
 class BuiltinObject(MethodObject):
     """ This class encapsulates handling of builtin functions. """
+    __slots__ = ()
+
     INSPECTORS = ('source',)
 
     def recompile(self, target, name):
@@ -16,15 +16,50 @@
    limitations under the License.
 '''
 
+from pytraits.support import is_sysname
 from ..base import TraitFactory
 
 
 class TraitObject:
+    # Primitives are created for every member of every trait, thus they are
+    # kept compact. Subclasses must define __slots__ too.
+    __slots__ = ("_object", )
+
     FACTORY = TraitFactory()
 
+    # Compiler does not have state of its own, thus single instance is shared
+    # by all primitives. Compiler is registered after primitives, thus it is
+    # bound when the factory is frozen.
+    COMPILER = None
+
+    # Placeholder of lazily composed traits and inspector of trait sources,
+    # bound along with the compiler.
+    LAZY_TRAIT = None
+    TRAIT_SOURCE = None
+
     def __init__(self, object):
         self._object = object
-        self._compiler = self.FACTORY["Compiler"]()
+
+    @property
+    def _compiler(self):
+        return self.COMPILER or self.FACTORY["Compiler"]()
+
+    @classmethod
+    def bind_factory(cls, factory):
+        """ Binds objects needed by primitives from frozen factory. """
+        cls.COMPILER = factory["Compiler"]() if factory else None
+        cls.LAZY_TRAIT = factory["LazyTrait"] if factory else None
+        cls.TRAIT_SOURCE = factory["TraitSourceInspector"] if factory else None
+
+    def _members(self, namespace):
+        """ Yields public members of namespace, binding lazily composed traits. """
+        lazy_trait = self.LAZY_TRAIT or self.FACTORY["LazyTrait"]
+        for name, value in list(namespace.items()):
+            if is_sysname(name):
+                continue
+            if isinstance(value, lazy_trait):
+                value = value.resolve()
+            yield name, value
 
     @classmethod
     def __str__(cls):
@@ -39,9 +74,17 @@ class TraitObject:
     def object(self):
         return self._object
 
+    @property
+    def identity(self):
+        """ Hashable object telling which traits compile to the same member. """
+        return self._object
+
     @property
     def qualname(self):
         try:
             return self._object.__qualname__
         except AttributeError:
             return type(self._object).__name__
+
+
+TraitFactory.bind(TraitObject.bind_factory)
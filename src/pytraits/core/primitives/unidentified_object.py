@@ -20,6 +20,8 @@ from .trait_object import TraitObject
 
 
 class UnidentifiedObject(TraitObject):
+    __slots__ = ()
+
     @classmethod
     def hook_into(cls, inspector):
         inspector.set_default_hook(cls)
@@ -54,7 +54,7 @@ def extendable(target):
             self._target_object = None
 
         def __call__(self, *args, **kwargs):
-            add_traits(self._target_object, *args, **kwargs)
+            return add_traits(self._target_object, *args, **kwargs)
 
         def __get__(self, instance, clazz):
             self._target_object = instance or clazz
@@ -16,11 +16,24 @@
    limitations under the License.
 '''
 
-from .singleton import Singleton
-from .inspector import Inspector
-from .factory import Factory
-from .magic import type_safe, type_converted
-from .utils import flatten, is_sysname, get_func_name
+from .lazy import lazy_import
 
 __all__ = ["Singleton", "Inspector", "Factory", "flatten", "type_safe",
-           "type_converted", "is_sysname", "errors", "get_func_name"]
+           "type_converted", "configure_checks", "register_converter",
+           "is_sysname", "errors", "get_func_name"]
+
+# Modules of public names, which are imported when the name is accessed first
+# time. See pytraits/__init__.py. Errors is a submodule.
+_MODULES = {"Singleton": ".singleton",
+            "Inspector": ".inspector",
+            "Factory": ".factory",
+            "type_safe": ".magic",
+            "type_converted": ".magic",
+            "configure_checks": ".magic",
+            "register_converter": ".magic",
+            "flatten": ".utils",
+            "is_sysname": ".utils",
+            "get_func_name": ".utils"}
+
+
+lazy_import(globals(), _MODULES)
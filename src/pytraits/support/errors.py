@@ -30,6 +30,7 @@ TypeConversionError = 'Conversion impossible!'
 ArgumentValueError = 'Unexpected value!'
 FirstTraitArgumentError = 'First argument must not be string!'
 TraitArgumentTypeError = "Expected list of trait names for given source object!"
+TraitConflictError = "Multiple traits with same name!"
 
 
 # Convert strings to exception objects
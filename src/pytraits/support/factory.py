@@ -16,7 +16,7 @@
    limitations under the License.
 '''
 
-import inspect
+import types
 
 from pytraits.support import Singleton
 from pytraits.support.errors import (FactoryError,
@@ -71,10 +71,15 @@ class Factory(metaclass=FactoryType):
     >>> example_instance.name
     'MyObject'
     """
+    # Set for each factory class separately, since the singleton instance
+    # can't be modified after it is created.
+    __frozen = False
+
     def __init__(self, override_duplicates=False):
         self.__methods = {}
         self.__classes = {}
         self.__override_duplicates = override_duplicates
+        self.__bindings = []
 
     @classmethod
     def register(cls, *classes, override=False, autoinit=True):
@@ -93,7 +98,11 @@ class Factory(metaclass=FactoryType):
             return classes[0]
 
     def __register(self, clazz, override, autoinit):
-        assert inspect.isclass(clazz)
+        assert isinstance(clazz, type)
+
+        if self.frozen:
+            msg = "Factory is frozen, can't register '{}'"
+            raise FactoryRegisterError(msg.format(clazz.__name__))
 
         # Make sure duplicates are not registered. By default, raise error
         # in order to avoid weird debugging errors. Duplicates, if tolerated,
@@ -141,11 +150,99 @@ class Factory(metaclass=FactoryType):
         """ Retrieves the original registered class. """
         return self.__access(self.__classes, name)
 
+    @classmethod
+    def freeze(cls):
+        """ Completes the registration and binds resolved factory methods.
+
+        Frozen factory does not accept new classes. Since factory methods
+        can't change anymore, modules can bind them once, instead of looking
+        them up from the factory every time they are needed.
+
+        >>> class FrozenFactory(Factory):
+        ...     pass
+        ...
+        >>> @FrozenFactory.register
+        ... class FrozenObject:
+        ...     pass
+        ...
+        >>> bound = {}
+        >>> FrozenFactory.bind(lambda factory: bound.update(factory.registry if factory else {}))
+        >>> FrozenFactory.freeze()
+        >>> bound["FrozenObject"] is FrozenObject
+        True
+        >>> FrozenFactory.register(type("Other", (), {}))
+        Traceback (most recent call last):
+        ...
+        pytraits.support.errors.FactoryRegisterError: Factory is frozen, can't register 'Other'
+        """
+        self = cls()
+        cls.__frozen = True
+        for binding in self.__bindings:
+            binding(self)
+
+    @classmethod
+    def bind(cls, binding):
+        """ Adds function binding factory methods when the factory is frozen.
+
+        Function is called with the factory, when the factory is frozen, and
+        with None, when the factory is reset, so that bound methods can be
+        released. Function is called right away, if the factory is already
+        frozen.
+        """
+        self = cls()
+        self.__bindings.append(binding)
+        if self.frozen:
+            binding(self)
+
+    @classmethod
+    def bind_names(cls, namespace, **names):
+        """ Binds factory methods to namespace, like globals() of a module.
+
+        Each keyword argument gives the name in namespace and the registered
+        name in factory. Names are set when the factory is frozen and cleared
+        to None, when the factory is reset.
+
+        >>> class NamedFactory(Factory):
+        ...     pass
+        ...
+        >>> @NamedFactory.register
+        ... class NamedObject:
+        ...     pass
+        ...
+        >>> namespace = {}
+        >>> NamedFactory.bind_names(namespace, Named="NamedObject")
+        >>> NamedFactory.freeze()
+        >>> namespace["Named"] is NamedObject
+        True
+        >>> NamedFactory.reset()
+        >>> namespace["Named"] is None
+        True
+        """
+        def binding(factory):
+            for name, registered in names.items():
+                namespace[name] = factory[registered] if factory else None
+        cls.bind(binding)
+
+    @property
+    def frozen(self):
+        return self.__frozen
+
+    @property
+    def registry(self):
+        """ Read-only mapping of names and factory methods. """
+        return types.MappingProxyType(self.__methods)
+
     @classmethod
     def reset(cls):
         """ Removes all registered classes. """
-        cls().__methods.clear()
-        cls().__classes.clear()
+        self = cls()
+        self.__methods.clear()
+        self.__classes.clear()
+
+        # Anything bound from the factory is invalid now.
+        cls.__frozen = False
+        for binding in self.__bindings:
+            binding(None)
 
     @property
     def registered_classes(self):
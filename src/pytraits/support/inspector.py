@@ -17,6 +17,7 @@
 '''
 
 import inspect
+import weakref
 from collections import OrderedDict as odict
 
 from pytraits.support.magic import type_safe
@@ -136,10 +137,19 @@ class Inspector:
                    ('instance', isclassinstance)])
     TYPENAMES = tuple(TYPES.keys())
 
+    # Checks whose result can not be determined by type of the object alone.
+    # All other checks are run only once per type and their results are
+    # reused for every object of the same type.
+    STATE_DEPENDENT = ('builtin', 'staticmethod', 'classmethod',
+                       'generatorfunction', 'descriptor', 'metaclass', 'class')
+
     def __init__(self, custom_types: odict=None):
         self.__custom_types = custom_types or odict()
         self.__hooks = odict()
         self.__default_hook = None
+        self.__plans = weakref.WeakKeyDictionary()
+        self.__stateful = set(self.TYPES[name] for name in self.STATE_DEPENDENT)
+        self.__stateful.update(self.__custom_types.values())
 
     def __iter__(self):
         # Favor custom types. It is possible to override default behavior.
@@ -158,30 +168,45 @@ class Inspector:
         except KeyError:
             return self.__custom_types[typename]
 
-    @type_safe
-    def inspect_many(self, *objects, all: bool=False):
-        """ Identify all arguments to certain type.
+    def inspect_many(self, objects, hooked_only=True):
+        """ Identifies type of each object in given iterable.
+
+        Objects are grouped by their type, so that checks depending only on
+        type are run once for each group. For those types that have a
+        registered hook, the hook will be called with the object for any
+        special handling needed for that type.
 
-        This function identifies all arguments to certain type and for those
-        types that have a registered hook, will be called with given object for
-        any special handling needed for that type.
+        >>> Inspector().inspect_many([1, "text", int, 2.0])
+        ['data', 'data', 'builtin', 'data']
 
         Returns:
-            List of identified objects.
+            List of identified objects in the same order as they were given.
         """
-        inspected = []
-        for object in objects:
-            inspected.append(self.__inspect_arg(object))
+        objects = list(objects)
+        hooked_only = bool(hooked_only)
+
+        groups = odict()
+        for index, object in enumerate(objects):
+            groups.setdefault(type(object), []).append(index)
+
+        inspected = [None] * len(objects)
+        for indexes in groups.values():
+            plan = self.__get_plan(objects[indexes[0]], hooked_only)
+            for index in indexes:
+                inspected[index] = self.__run_plan(plan, objects[index])
 
         return inspected
 
-    @type_safe
-    def inspect(self, object, hooked_only: bool=True):
+    def inspect(self, object, hooked_only=True):
         """ Identifies type of single object.
 
         Loops over every type check defined in Inspector.TYPES dictionary and
         returns type for the first check that qualifies the object.
 
+        Checks are run through only once for each type of object. After that,
+        only checks depending on state of the object are run again, others are
+        known to fail or succeed for that type already.
+
         Args:
             object (anything): Object needs to be identified.
             hooked_only (bool): Switch to decide whether all types are checked
@@ -193,29 +218,55 @@ class Inspector:
             If no hook found, then name of object type.
             If hook is found, then any object returned by hook.
         """
-        for typename, check in self:
-            # Skip checks if it is not required for this type.
-            if hooked_only and len(self.__hooks) and typename not in self.__hooks:
-                continue
-
-            # Keep going if object is not matching.
-            if not check(object):
-                continue
+        return self.__run_plan(self.__get_plan(object, bool(hooked_only)), object)
 
-            if typename in self.__hooks:
-                return self.__hooks[typename](object)
-            elif self.__default_hook:
-                return self.__default_hook(object)
-            else:
-                return typename
+    def __get_plan(self, object, hooked_only):
+        try:
+            return self.__plans[type(object)][hooked_only]
+        except KeyError:
+            return self.__build_plan(object, hooked_only)
+
+    def __run_plan(self, plan, object):
+        for typename, check in plan:
+            # Checks already known to qualify the type are marked with None.
+            if check is None or check(object):
+                if typename in self.__hooks:
+                    return self.__hooks[typename](object)
+                elif self.__default_hook:
+                    return self.__default_hook(object)
+                else:
+                    return typename
 
         # Situation that occurs when receiving a type checks are not covering.
         if self.__default_hook:
             return self.__default_hook(object)
         return None
 
+    def __build_plan(self, object, hooked_only):
+        """ Collects checks that are needed to identify objects of this type.
+
+        Checks that only depend on type of the object are evaluated here
+        against given object. Failing ones are left out and the first one
+        qualifying the object ends the plan.
+        """
+        plan = []
+        for typename, check in self:
+            # Skip checks if it is not required for this type.
+            if hooked_only and len(self.__hooks) and typename not in self.__hooks:
+                continue
+
+            if check in self.__stateful:
+                plan.append((typename, check))
+            elif check(object):
+                plan.append((typename, None))
+                break
+
+        plan = tuple(plan)
+        self.__plans.setdefault(type(object), {})[hooked_only] = plan
+        return plan
+
     @type_safe
-    def add_typecheck(self, name: str, callable=None):
+    def add_typecheck(self, name: str, callable=None, by_type: bool=False):
         """ Adds typecheck for given name.
 
         This method allows adding custom typechecks. It's possible to either
@@ -230,13 +281,18 @@ class Inspector:
                       and returns True or False as an answer. If None, existing
                       type check is promoted to be custom. This changes priority
                       of checks so that desired checks are run earlier.
+            by_type: True, if result of the callable depends only on type of
+                     the object, which allows caching it per type.
 
         Raises:
             ValueError when there already is a custom type check for given name.
         """
         if name in self.__custom_types:
             raise ValueError("Type '{}' already exists".format(name))
+        if callable and not by_type:
+            self.__stateful.add(callable)
         self.__custom_types[name] = callable or self.TYPES[name]
+        self.__plans.clear()
 
     @type_safe
     def del_typecheck(self, name: str):
@@ -245,6 +301,7 @@ class Inspector:
             del self.__custom_types[name]
         except KeyError:
             pass
+        self.__plans.clear()
 
     @type_safe
     def add_hook(self, name: str, callable):
@@ -256,6 +313,7 @@ class Inspector:
         """
         assert name in self.typenames, "'{}' not in '{}'".format(name, self.typenames)
         self.__hooks[name] = callable
+        self.__plans.clear()
 
     @type_safe
     def del_hook(self, name: str):
@@ -264,6 +322,7 @@ class Inspector:
             del self.__hooks[name]
         except KeyError:
             pass
+        self.__plans.clear()
 
     def set_default_hook(self, callable):
         self.__default_hook = callable
@@ -274,6 +333,7 @@ class Inspector:
     def clear(self):
         """ Removes all the hooks. """
         self.__hooks = odict()
+        self.__plans.clear()
 
     @property
     def hooks(self):
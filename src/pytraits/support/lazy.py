@@ -0,0 +1,69 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+'''
+   Copyright 2014-2015 Teppo Perä
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+'''
+
+import sys
+import importlib
+
+__all__ = ["lazy_import"]
+
+
+def lazy_import(namespace, modules):
+    """ Makes package import its public names only when they are accessed.
+
+    Adds module level __getattr__ and __dir__ (PEP 562) to the namespace of
+    the package. Names found from modules are imported from the given module
+    and any other name is imported as a submodule of the package. Imported
+    names are stored into the namespace, thus they are looked up only once.
+    Python versions before 3.7 import every name of __all__ right away.
+
+    Args:
+        namespace: Namespace of the package, i.e. globals().
+        modules: Dictionary of public names and modules they are imported from.
+                 Module names can be relative to the package.
+    """
+    package = namespace["__name__"]
+
+    def __getattr__(name):
+        try:
+            module = modules[name]
+        except KeyError:
+            value = _import_submodule(package, name)
+        else:
+            value = getattr(importlib.import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(namespace["__all__"]))
+
+    namespace["__getattr__"] = __getattr__
+    namespace["__dir__"] = __dir__
+
+    if sys.version_info[:2] < (3, 7):
+        for name in namespace["__all__"]:
+            __getattr__(name)
+
+
+def _import_submodule(package, name):
+    """ Imports submodule, which used to be imported along with the package. """
+    try:
+        return importlib.import_module("." + name, package)
+    except ImportError as error:
+        if error.name != "{}.{}".format(package, name):
+            raise
+    raise AttributeError("module {!r} has no attribute {!r}".format(package, name))
@@ -16,16 +16,180 @@
    limitations under the License.
 '''
 
-import inspect
+import os
+import sys
+import enum
+import decimal
+import datetime
 import itertools
 import functools
+import types
 
 from pytraits.support.errors import TypeConversionError, ArgumentValueError
 from pytraits.support.utils import get_func_name
 from pytraits.support.utils import get_signature
 
 
-__all__ = ["type_safe", "type_converted"]
+__all__ = ["type_safe", "type_converted", "configure_checks", "register_converter"]
+
+
+def _read_sampling(value):
+    try:
+        sampling = int(value or 1)
+    except ValueError:
+        sampling = 0
+    if sampling < 1:
+        msg = "PYTRAITS_CHECK_SAMPLING must be a positive integer, got '{}'"
+        raise ValueError(msg.format(value))
+    return sampling
+
+
+# Process wide settings for decorators in this module. Read from environment
+# variables PYTRAITS_CHECKS ("0", "false", "off" or "no" to disable) and
+# PYTRAITS_CHECK_SAMPLING (check only one of given number of calls).
+_SETTINGS = {
+    "enabled": os.environ.get("PYTRAITS_CHECKS", "1").lower() not in ("0", "false", "off", "no"),
+    "sampling": _read_sampling(os.environ.get("PYTRAITS_CHECK_SAMPLING"))}
+
+
+def configure_checks(enabled: bool=None, sampling: int=None):
+    """ Changes process wide behavior of type_safe, type_converted and validation.
+
+    Settings are applied when function is decorated, thus they need to be set
+    before any modules using the decorators are imported. Environment
+    variables PYTRAITS_CHECKS and PYTRAITS_CHECK_SAMPLING can be used for the
+    same purpose.
+
+    Args:
+        enabled: When False, type_safe and validation return the original
+                 function as is. Values are still converted by type_converted.
+        sampling: Number N, where only one of N calls of each function is
+                  checked. Values are still converted on every call by
+                  type_converted.
+
+    Returns:
+        Dictionary of current settings.
+
+    >>> configure_checks(enabled=False)
+    {'enabled': False, 'sampling': 1}
+    >>> def function(value: int): return value
+    >>> type_safe(function) is function
+    True
+    >>> configure_checks(enabled=True)
+    {'enabled': True, 'sampling': 1}
+    """
+    if enabled is not None:
+        _SETTINGS["enabled"] = enabled
+    if sampling is not None:
+        assert sampling >= 1, "Sampling must be positive number!"
+        _SETTINGS["sampling"] = sampling
+    return dict(_SETTINGS)
+
+
+def _convert_bool(target, value):
+    if isinstance(value, bool):
+        return value
+
+    elif isinstance(value, str):
+        if value.lower() == "true":
+            return True
+        if value.lower() == "false":
+            return False
+
+    elif isinstance(value, int):
+        if not value:
+            return False
+        if value == 1:
+            return True
+
+    raise TypeConversionError()  # This will be caught by type_converted.
+
+
+def _convert_decimal(target, value):
+    # Floats are converted through their shortest representation, otherwise
+    # 0.1 would become 0.1000000000000000055511151231257827...
+    if isinstance(value, float):
+        value = repr(value)
+    try:
+        return target(value)
+    except decimal.InvalidOperation:
+        raise TypeConversionError()
+
+
+def _convert_enum(target, value):
+    try:
+        return target(value)
+    except ValueError:
+        pass
+    try:
+        return target[value]
+    except (KeyError, TypeError):
+        raise TypeConversionError()
+
+
+# Dates and times can be parsed from ISO format only since Python 3.7.
+_PARSES_ISO_FORMAT = sys.version_info[:2] >= (3, 7)
+
+
+def _convert_date(target, value):
+    # Datetime is a date too, thus it is passed as is.
+    if isinstance(value, target):
+        return value
+    if isinstance(value, str) and _PARSES_ISO_FORMAT:
+        return target.fromisoformat(value)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return target.fromtimestamp(value)
+    raise TypeConversionError()
+
+
+# Registered converters of type_converted. Converter is called with annotated
+# type and the value, and it is used also for subclasses of registered type.
+# Types without converter are called with the value.
+_CONVERTERS = {bool: _convert_bool,
+               decimal.Decimal: _convert_decimal,
+               enum.Enum: _convert_enum,
+               datetime.date: _convert_date}
+
+
+def register_converter(target, converter=None):
+    """ Registers converter used by type_converted for given type and its subclasses.
+
+    Converters are looked up when function is decorated, thus converter
+    affects only functions decorated after registering it. Converter is
+    called with annotated type and the value and it should raise
+    TypeConversionError, TypeError or ValueError if value can't be converted.
+    Can be used as a decorator too.
+
+    >>> class Point:
+    ...     def __init__(self, x, y):
+    ...         self.x, self.y = x, y
+    ...
+    >>> @register_converter(Point)
+    ... def to_point(target, value):
+    ...     return target(*map(int, value.split(",")))
+    ...
+    >>> @type_converted
+    ... def distance(point: Point):
+    ...     return point.x + point.y
+    ...
+    >>> distance("1,2")
+    3
+    """
+    def register(converter):
+        _CONVERTERS[target] = converter
+        return converter
+
+    return register if converter is None else register(converter)
+
+
+def _resolve_converter(target):
+    """
+    Finds converter for given type, closest registered base class wins.
+    """
+    for base in getattr(target, "__mro__", ()):
+        if base in _CONVERTERS:
+            return functools.partial(_CONVERTERS[base], target)
+    return target
 
 
 class ErrorMessage:
@@ -82,107 +246,228 @@ class type_safe:
     ...
     TypeError: check() missing 1 required positional argument: 'anything'
     """
+    MAIN_MSG = 'While calling {}:'
+    REPEAT_MSG = "parameter '{name}' had value '{value}' of type '{typename}'"
+
+    # Subclasses analyzing every call, like validating values, turn type
+    # checks off so that only number of arguments is verified before that.
+    CHECK_TYPES = True
+
+    # Expression used by generated check to tell whether argument matches
+    # its annotation.
+    MATCH = "isinstance({value}, {type})"
+
+    # Subclasses, whose analysis changes the arguments, can not skip any
+    # calls when sampling.
+    SAMPLED = True
+
+    def __new__(cls, function):
+        # Disabled checks cost nothing, since original function is used.
+        if not _SETTINGS["enabled"]:
+            return function
+        return super().__new__(cls)
+
     def __init__(self, function):
         self._function = function
         functools.update_wrapper(self, function)
-        self.__signature = inspect.signature(function)
-        self._specs = inspect.getfullargspec(self._function)
-        self._self = None
-        self._errors = ErrorMessage(
-            'While calling {}:',
-            "parameter '{name}' had value '{value}' of type '{typename}'",
-            get_signature(function))
+        self._parameters = self._parameter_table()
+        self._needs_analysis = self._compile_check()
+        if self.SAMPLED and _SETTINGS["sampling"] > 1:
+            self._needs_analysis = self._sample(self._needs_analysis, _SETTINGS["sampling"])
 
     def __get__(self, instance, clazz):
         """
-        Stores calling instances and returns this decorator object as function.
+        Binds this decorator object to calling instance.
         """
         # In Python, every function is a property. Before Python invokes function,
         # it must access the function using __get__, where it can deliver the calling
-        # object. After the __get__, function is ready for being invoked by __call__.
-        self._self = instance
-        return self
+        # object. Bound method is created for each access, thus the decorator
+        # itself is never modified and can be shared between threads.
+        if instance is None:
+            return self
+        return types.MethodType(self, instance)
+
+    def _describe(self):
+        """
+        Returns description of decorated function used in error messages.
+        """
+        return get_signature(self._function)
 
-    def iter_positional_args(self, args):
+    def _error_message(self, errors):
+        """
+        Builds error message out of errors collected during single call.
         """
-        Yields type, name, value combination of function arguments.
+        # Rendering the signature is slow compared to decorating the function,
+        # thus it is done only when the message is needed.
+        message = ErrorMessage(self.MAIN_MSG, self.REPEAT_MSG, self._describe())
+        for error in errors:
+            message.add(**error)
+        return str(message)
+
+    def _parameter_table(self):
+        """
+        Collects position, name and annotation of each annotated parameter.
+
+        Position of keyword-only parameters is None.
+        """
+        # __annotations__ is a dictionary of argument name and annotation.
+        # We accept empty annotations, in which case the argument has no
+        # type requirement.
+        annotations = self._function.__annotations__
+        if not annotations:
+            return ()
+
+        # Names of the parameters are read directly from the code of plain
+        # functions, which is much faster than getting full argument spec.
+        if isinstance(self._function, types.FunctionType):
+            code = self._function.__code__
+            args = code.co_varnames[:code.co_argcount]
+            kwonlyargs = code.co_varnames[code.co_argcount:code.co_argcount + code.co_kwonlyargcount]
+        else:
+            import inspect  # Slow to import and rarely needed.
+            specs = inspect.getfullargspec(self._function)
+            args, kwonlyargs = specs.args, specs.kwonlyargs
+
+        table = [(index, name, annotations[name])
+                 for index, name in enumerate(args)
+                 if annotations.get(name)]
+        table.extend((None, name, annotations[name])
+                     for name in kwonlyargs
+                     if annotations.get(name))
+        return tuple(table)
+
+    def iter_args(self, args, kwargs):
+        """
+        Yields key, name, annotation and value of each given annotated argument.
+
+        Key is the position of the argument in args or its name in kwargs.
+        Omitted arguments are skipped, function gets default values for them.
         """
-        # specs.args contains all arguments of the function. Loop here all
-        # argument names and their values putting them together. If there
-        # are arguments missing values, fill them with None.
-        for name, val in itertools.zip_longest(self._specs.args, args, fillvalue=None):
-            # __annotations__ is a dictionary of argument name and annotation.
-            # We accept empty annotations, in which case the argument has no
-            # type requirement.
-            yield self._function.__annotations__.get(name, None), name, val
-
-    def _analyze_args(self, args):
+        count = len(args)
+        for index, name, annotation in self._parameters:
+            if index is not None and index < count:
+                yield index, name, annotation, args[index]
+            elif name in kwargs:
+                yield name, name, annotation, kwargs[name]
+
+    def _analyze_args(self, args, kwargs):
         """
-        Invoked by __call__ in order to work with positional arguments.
+        Invoked by __call__ in order to work with given arguments.
 
         This function does the actual work of evaluating arguments against
         their annotations. Any deriving class can override this function
         to do different kind of handling for the arguments. Overriding function
-        must return list of arguments that will be used to call the decorated
-        function.
+        must return positional and keyword arguments that will be used to call
+        the decorated function.
 
-        @param args: Arguments given for the function.
-        @return same list of arguments given in parameter.
+        @param args: Positional arguments given for the function.
+        @param kwargs: Keyword arguments given for the function.
+        @return same arguments given in parameters.
         """
-        # TODO: inspect.Signature does quite lot of similar things. Figure
-        #       out, how to take advantage of that.
-        for arg_type, arg_name, arg_value in self.iter_positional_args(args):
-            if not arg_type or isinstance(arg_value, arg_type):
+        errors = []
+        for _, arg_name, arg_type, arg_value in self.iter_args(args, kwargs):
+            if isinstance(arg_value, arg_type):
                 continue
 
-            self._errors.add(
+            errors.append(dict(
                 typename=type(arg_value).__name__,
                 name=arg_name,
-                value=arg_value)
+                value=arg_value))
 
-        if self._errors:
-            raise TypeError(str(self._errors))
+        if errors:
+            raise TypeError(self._error_message(errors))
 
-        return args
+        return args, kwargs
 
-    def __match_arg_count(self, args):
+    def _compile_check(self):
         """
-        Verifies that proper number of arguments are given to function.
+        Generates function telling whether arguments need to be analyzed.
+
+        Annotations are fixed when function is decorated, thus the check is
+        compiled once into straight-line code. For function like
+        'def example(value: int, other, *rest, flag: bool=False)' it looks
+        like this:
+
+            def needs_analysis(args, kwargs, len=len, isinstance=isinstance, type=type):
+                count = len(args)
+                if not kwargs and count > 0:
+                    return not (isinstance(args[0], type_0))
+                value = args[0] if count > 0 else kwargs.get('value', omitted)
+                if value is not omitted and not isinstance(value, type_0):
+                    return True
+                value = kwargs.get('flag', omitted)
+                if value is not omitted and not isinstance(value, type_1):
+                    return True
+                return False
+
+        First branch handles the usual case, where all annotated positional
+        arguments are given as such. Omitted arguments are not checked, since
+        either default value is used or calling the function gives the error.
         """
-        # With default values this verification is bit tricky. In case
-        # given arguments match with number of arguments in function signature,
-        # we can proceed.
-        if len(args) == len(self._specs.args):
-            return True
+        namespace = {"omitted": object()}
+        lines = ["def needs_analysis(args, kwargs, len=len, isinstance=isinstance, type=type):"]
+
+        if not self.CHECK_TYPES:
+            lines.append("    return True")
+        elif not self._parameters:
+            lines.append("    return False")
+        else:
+            lines.append("    count = len(args)")
+
+            positional = []
+            for number, (index, name, annotation) in enumerate(self._parameters):
+                namespace["type_{}".format(number)] = annotation
+                if index is None:
+                    lines.append("    value = kwargs.get({!r}, omitted)".format(name))
+                else:
+                    positional.append(self.MATCH.format(value="args[{}]".format(index),
+                                                        type="type_{}".format(number)))
+                    lines.append("    value = args[{0}] if count > {0} else "
+                                 "kwargs.get({1!r}, omitted)".format(index, name))
+                lines.append("    if value is not omitted and not {}:".format(
+                    self.MATCH.format(value="value", type="type_{}".format(number))))
+                lines.append("        return True")
+            lines.append("    return False")
+
+            # Annotated positional parameters are first in the table.
+            if positional:
+                last = self._parameters[len(positional) - 1][0]
+                lines[2:2] = ["    if not kwargs and count > {}:".format(last),
+                              "        return not ({})".format(" and ".join(positional))]
+
+        exec(self._compile_source("\n".join(lines)), namespace)
+        return namespace["needs_analysis"]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _compile_source(source):
+        """
+        Compiles source of generated check.
 
-        # It's possible to have less arguments given than defined in function
-        # signature in case any default values exist.
-        if len(args) - len(self._specs.defaults or []) == len(self._specs.args):
-            return True
+        Functions with same kind of parameters get same source, only their
+        annotations in the namespace differ, thus compiled code is cached.
+        """
+        return compile(source, "<type_safe check>", "exec")
 
-        # When exceeding number of args, also check if function accepts
-        # indefinite number of positional arguments.
-        if len(args) > len(self._specs.args) and self._specs.varargs:
-            return True
+    @staticmethod
+    def _sample(check, rate):
+        """
+        Wraps the check so that only one of given number of calls is checked.
+        """
+        # Counter of itertools is advanced atomically, thus it is safe to be
+        # used from multiple threads.
+        calls = itertools.count(1)
 
-        # We got either too many arguments or too few.
-        return False
+        def sampled_check(args, kwargs):
+            return not next(calls) % rate and check(args, kwargs)
+        return sampled_check
 
     def __call__(self, *args, **kwargs):
         """
         Converts annotated types into proper type and calls original function.
         """
-        self._errors.reset()
-
-        # Methods require instance of the class to be first argument. We
-        # stored it in __get__ and now add it to argument list so that
-        # function can be invoked correctly.
-        if self._self:
-            args = (self._self, ) + args
-
-        # Before doing any type checks, make sure argument count matches.
-        if self.__match_arg_count(args):
-            args = self._analyze_args(args)
+        if self._needs_analysis(args, kwargs):
+            args, kwargs = self._analyze_args(args, kwargs)
 
         return self._function(*args, **kwargs)
 
@@ -213,27 +498,33 @@ class type_converted(type_safe):
        - got arg 'value' as 'None' of type 'NoneType' which cannot be converted to 'int'
        - got arg 'answer' as 'None' of type 'NoneType' which cannot be converted to 'bool'
     """
+    REPEAT_MSG = ("got arg '{name}' as '{value}' of type '{typename}' "
+                  "which cannot be converted to '{expectedtype}'")
+    SAMPLED = False
+
+    # Values already having exactly the annotated type are passed as is, also
+    # without calling the function analyzing the arguments. Subclasses are
+    # still converted, e.g. True is converted to 1 for an 'int' parameter.
+    MATCH = "type({value}) is {type}"
+
+    def __new__(cls, function):
+        # Conversion changes the values, thus it can't be switched off.
+        return object.__new__(cls)
+
     def __init__(self, function):
         super().__init__(function)
-        self.__converters = {bool: self.boolean_conversion}
-        self._errors = ErrorMessage(
-            'While calling {}:',
-            "got arg '{name}' as '{value}' of type '{typename}' "
-            "which cannot be converted to '{expectedtype}'",
-            get_signature(function))
+        self._conversions = tuple(_resolve_converter(annotation)
+                                  for _, _, annotation in self._parameters)
 
     def convert(self, arg_type, arg_name, arg_value):
         """
         Converts argument to given type.
         """
         # If no type required, return value as is.
-        if arg_type is None:
+        if arg_type is None or type(arg_value) is arg_type:
             return arg_value
 
-        try:
-            return self.__converters[arg_type](arg_value)
-        except KeyError:
-            return arg_type(arg_value)
+        return _resolve_converter(arg_type)(arg_value)
 
     def boolean_conversion(self, value):
         """
@@ -246,44 +537,93 @@ class type_converted(type_safe):
         >>> conv.boolean_conversion(1), conv.boolean_conversion(0)
         (True, False)
         """
-        if isinstance(value, bool):
-            return value
-
-        elif isinstance(value, str):
-            if value.lower() == "true":
-                return True
-            if value.lower() == "false":
-                return False
+        return _convert_bool(bool, value)
 
-        elif isinstance(value, int):
-            if not value:
-                return False
-            if value == 1:
-                return True
-
-        raise TypeConversionError()  # This will be caught by convert method.
-
-    def _analyze_args(self, args):
+    def _analyze_args(self, args, kwargs):
         """
         Converts annotated types into proper type and calls original function.
         """
-        self._errors.reset()
-        new_args = []
+        errors = []
+        new_args = list(args)
+        new_kwargs = dict(kwargs)
+        count = len(args)
+
+        # Converters were resolved when function was decorated.
+        for (index, arg_name, arg_type), converter in zip(self._parameters, self._conversions):
+            if index is not None and index < count:
+                key = index
+            elif arg_name in kwargs:
+                key = arg_name
+            else:
+                continue
+
+            arg_value = args[key] if key == index else kwargs[key]
+            if type(arg_value) is arg_type:
+                continue
 
-        for arg_type, arg_name, arg_value in self.iter_positional_args(args):
             try:
-                new_args.append(self.convert(arg_type, arg_name, arg_value))
-            except (TypeConversionError, TypeError):
-                self._errors.add(
+                converted = converter(arg_value)
+            except (TypeConversionError, TypeError, ValueError):
+                errors.append(dict(
                     name=arg_name,
                     value=arg_value,
                     typename=type(arg_value).__name__,
-                    expectedtype=arg_type.__name__)
+                    expectedtype=getattr(arg_type, "__name__", arg_type)))
+                continue
+
+            if key == index:
+                new_args[key] = converted
+            else:
+                new_kwargs[key] = converted
+
+        if errors:
+            raise TypeConversionError(self._error_message(errors))
+
+        return new_args, new_kwargs
+
 
-        if self._errors:
-            raise TypeConversionError(str(self._errors))
+class Interval:
+    """ Annotation for validation accepting values between given limits.
 
-        return new_args
+    Limits are inclusive unless told otherwise. Values that can not be compared
+    with the limits are not accepted.
+
+    >>> 5 in Interval(1, 10), 10 in Interval(1, 10, closed=False), "5" in Interval(1, 10)
+    (True, False, False)
+    >>> Interval(0.0, 1.0, closed=False)
+    Interval(0.0, 1.0, closed=False)
+    """
+    __slots__ = ("low", "high", "closed")
+
+    def __init__(self, low, high, closed=True):
+        self.low = low
+        self.high = high
+        self.closed = closed
+
+    def __contains__(self, value):
+        try:
+            if self.closed:
+                return self.low <= value <= self.high
+            return self.low < value < self.high
+        except TypeError:
+            return False
+
+    def __repr__(self):
+        closed = "" if self.closed else ", closed=False"
+        return "Interval({!r}, {!r}{})".format(self.low, self.high, closed)
+
+
+class _RangeValues:
+    """
+    Checks membership of range without iterating it for non-integer values.
+    """
+    __slots__ = ("values",)
+
+    def __init__(self, values):
+        self.values = values
+
+    def __contains__(self, value):
+        return isinstance(value, int) and value in self.values
 
 
 class validation(type_safe):
@@ -307,34 +647,85 @@ class validation(type_safe):
     ...
     pytraits.support.errors.ArgumentValueError: While calling 'show_number':
        - got arg 'number' as '5' of type 'str' which is not any of these values: (1, 2, 3, 5)
+
+    Ranges and intervals are checked without going through the values.
+
+    >>> @validation
+    ... def show_percentage(value: Interval(0, 100), step: range(0, 100, 5)):
+    ...     return value, step
+    ...
+    >>> show_percentage(12.5, 95)
+    (12.5, 95)
+
+    >>> show_percentage(101, 2)
+    Traceback (most recent call last):
+    ...
+    pytraits.support.errors.ArgumentValueError: While calling 'show_percentage':
+       - got arg 'value' as '101' of type 'int' which is not any of these values: Interval(0, 100)
+       - got arg 'step' as '2' of type 'int' which is not any of these values: range(0, 100, 5)
     """
+    MAIN_MSG = "While calling '{}':"
+    REPEAT_MSG = ("got arg '{name}' as '{value}' of type '{typename}' "
+                  "which is not any of these values: {values}")
+    CHECK_TYPES = False
+
     def __init__(self, function):
         super().__init__(function)
-        self.__function = function
-        self._errors = ErrorMessage(
-            "While calling '{}':",
-            "got arg '{name}' as '{value}' of type '{typename}' "
-            "which is not any of these values: {values}",
-            get_func_name(function))
-
-    def _analyze_args(self, args):
-        self._errors.reset()
-
-        for arg_values, arg_name, arg_value in self.iter_positional_args(args):
-            if not arg_values:
-                continue
+        self._allowed = tuple(self._compile_values(annotation)
+                              for _, _, annotation in self._parameters)
 
-            arg_values = tuple([arg_values]) if not isinstance(arg_values, tuple) else arg_values
-            if arg_value not in arg_values:
-                self._errors.add(name=arg_name,
-                                 value=arg_value,
-                                 typename=type(arg_value).__name__,
-                                 values=arg_values)
+    def _describe(self):
+        return get_func_name(self._function)
 
-        if self._errors:
-            raise ArgumentValueError(str(self._errors))
+    @staticmethod
+    def _compile_values(annotation):
+        """
+        Converts annotation into container of allowed values and the values shown in errors.
+
+        Allowed values are fixed when function is decorated, thus they are
+        stored into frozenset for quick lookups. Tuple is used when some of
+        the values can't be hashed.
+        """
+        if isinstance(annotation, Interval):
+            return annotation, annotation
+        if isinstance(annotation, range):
+            return _RangeValues(annotation), annotation
 
-        return args
+        values = annotation if isinstance(annotation, tuple) else (annotation,)
+        try:
+            return frozenset(values), values
+        except TypeError:
+            return values, values
+
+    def _analyze_args(self, args, kwargs):
+        errors = []
+        count = len(args)
+
+        for (index, arg_name, _), (allowed, arg_values) in zip(self._parameters, self._allowed):
+            if index is not None and index < count:
+                arg_value = args[index]
+            elif arg_name in kwargs:
+                arg_value = kwargs[arg_name]
+            else:
+                continue
+
+            try:
+                if arg_value in allowed:
+                    continue
+            except TypeError:
+                # Unhashable value can still be equal to one of the values.
+                if arg_value in arg_values:
+                    continue
+
+            errors.append(dict(name=arg_name,
+                               value=arg_value,
+                               typename=type(arg_value).__name__,
+                               values=arg_values))
+
+        if errors:
+            raise ArgumentValueError(self._error_message(errors))
+
+        return args, kwargs
 
 
 if __name__ == "__main__":
@@ -16,6 +16,8 @@
    limitations under the License.
 '''
 
+import threading
+
 from pytraits.support.errors import SingletonError
 
 
@@ -52,17 +54,44 @@ class Singleton(type):
     ...
     pytraits.support.errors.SingletonError: Singletons are immutable!
     """
-    def __call__(self, *args, **kwargs):
-        try:
-            return self.__instance
-        except AttributeError:
-            def immutable_object(*args):
+    def __init__(cls, name, bases, attrs):
+        super().__init__(name, bases, attrs)
+
+        # Every class gets own slot for the instance, thus subclasses never
+        # see the instance of their parent class.
+        cls.__instance = None
+        cls.__lock = threading.RLock()
+
+    def __call__(cls, *args, **kwargs):
+        instance = cls.__instance
+        if instance is not None:
+            return instance
+
+        # Only the first call gets here. Lock makes sure that threads racing
+        # on the first call get the same instance.
+        with cls.__lock:
+            if cls.__instance is None:
+                instance = super().__call__(*args, **kwargs)
+                cls.__make_immutable('__setitem__')
+                cls.__make_immutable('__setattr__')
+                cls.__instance = instance
+        return cls.__instance
+
+    def __make_immutable(cls, name):
+        """ Prevents modifying the instance of the class after it is created.
+
+        Subclasses inherit the guard, but can still initialize their own
+        instances using the original function of the class.
+        """
+        original = getattr(cls, name, None)
+
+        def immutable_object(self, *args):
+            if original is None or self is type(self).__instance:
                 raise SingletonError()
+            return original(self, *args)
+
+        setattr(cls, name, immutable_object)
 
-            self.__instance = super().__call__(*args, **kwargs)
-            self.__setitem__ = immutable_object
-            self.__setattr__ = immutable_object
-            return self.__instance
 
 if __name__ == "__main__":
     import doctest
@@ -16,8 +16,6 @@
    limitations under the License.
 '''
 
-import inspect
-
 
 def is_sysname(name: str):
     """ Quick check if name is system specific.
@@ -98,6 +96,9 @@ def get_signature(function):
     >>> get_signature(Test.test)
     'Test.test(self, arg, *args, **kwargs)'
     """
+    # Imported here, since inspect is slow to import and signature is needed
+    # only for error messages.
+    import inspect
     sig = inspect.signature(function)
     return "{}{}".format(get_func_name(function), str(sig))
 
@@ -17,23 +17,32 @@
 '''
 
 from pytraits.core import TraitFactory
-from pytraits.support import type_converted
 
+TraitTarget = Traits = CompositionPlan = None
+TraitFactory.bind_names(globals(),
+                        TraitTarget="TraitTargetInspector",
+                        Traits="Traits",
+                        CompositionPlan="CompositionPlan")
 
-TraitTarget = TraitFactory["TraitTargetInspector"]
-Traits = TraitFactory["Traits"]
 
-
-@type_converted
-def add_traits(target: TraitTarget, *traits, **resolutions):
+def add_traits(target, *traits, lazy=False, policy=None, **resolutions):
     """ Bind new traits to given object.
 
     Args:
         target: Object of any type that is going to be extended with traits
         traits: Tuple of traits as object and strings or callables or functions.
+        lazy: When True, methods composed to classes are compiled only when
+              they are accessed first time.
+        policy: What to do when names of traits collide with each other or
+                with the target, see Resolutions. Last trait wins by default.
         resolutions: dictionary of conflict resolutions to solve situations
                      where multiple methods or properties of same name are
-                     encountered in traits.
+                     encountered in traits. Names 'lazy' and 'policy' are
+                     taken by the arguments above, thus traits of those names
+                     can't be renamed or left out here.
+
+    Returns:
+        (dict) names composed to target and qualified names of their traits.
 
     >>> class ExampleClass:
     ...    def example_method(self):
@@ -44,20 +53,70 @@ def add_traits(target: TraitTarget, *traits, **resolutions):
     ...        return 42
     ...
     >>> add_traits(ExampleClass, ExampleTrait)
+    {'other_method': 'ExampleTrait.other_method'}
     >>> ExampleClass().other_method()
     42
+    >>> add_traits(ExampleClass, ExampleTrait, policy="first")
+    {}
+
+    >>> class LazyClass:
+    ...    pass
+    ...
+    >>> _ = add_traits(LazyClass, ExampleTrait, lazy=True)
+    >>> type(LazyClass.__dict__["other_method"]).__name__
+    'LazyTrait'
+    >>> LazyClass().other_method()
+    42
+    >>> type(LazyClass.__dict__["other_method"]).__name__
+    'function'
     """
     # Return immediately, if no traits provided.
     if not len(traits):
-        return
+        return {}
 
-    # Just prepare object to start the work and get done with it.
+    # Just prepare object to start the work and get done with it. Target is
+    # converted here instead of using type_converted, since it is done for
+    # every composition.
+    target = TraitTarget(target)
     traits = Traits(traits)
 
     # This call puts all gears moving. Each trait in turn is being added
     # to target object. Resolutions are used to solve any conflicts along
     # the way.
-    traits.compose(target, resolutions)
+    return traits.compose(target, resolutions, policy, lazy)
+
+
+def compile_traits(*traits, policy=None, **resolutions):
+    """ Prepare traits to be bound to many objects.
+
+    Does the same work as add_traits, but only once for each kind of target.
+    Returned plan can be applied to any number of classes or instances.
+
+    Args:
+        traits: Tuple of traits as object and strings or callables or functions.
+        policy: What to do when names of traits collide with each other,
+                see Resolutions. Last trait wins by default.
+        resolutions: dictionary of conflict resolutions to solve situations
+                     where multiple methods or properties of same name are
+                     encountered in traits.
+
+    >>> class ExampleTrait:
+    ...    def other_method(self):
+    ...        return 42
+    ...
+    >>> plan = compile_traits(ExampleTrait, other_method="answer")
+    >>> class First:
+    ...    pass
+    ...
+    >>> class Second:
+    ...    pass
+    ...
+    >>> plan.apply(First)
+    >>> plan.apply(Second())
+    >>> First().answer()
+    42
+    """
+    return CompositionPlan(traits, resolutions, policy)
 
 
 if __name__ == '__main__':
@@ -1,6 +1,9 @@
 #!/usr/bin/python -tt
 # -*- coding: utf-8 -*-
+import dis
+import gc
 import unittest
+import weakref
 
 from utils import for_examples
 
@@ -16,6 +19,17 @@ class TestDummy:
     def __private_func(self): pass
     def _hidden_func(self): pass
     def public_func(self): pass
+    def private_access(self): return self.__value
+    def nested_access(self): return [item.__value for item in (self, )][0]
+    def lambda_access(self): return (lambda: self.__value)()
+    def defaults(self, value=1, *, other=2): return value, other
+    def private_defaults(self, value=1, *, other=2): return self.__value, value, other
+
+
+def decorated(function):
+    def wrapper(self, *args):
+        return function(self, *args)
+    return wrapper
 
 
 class TestCompiler(unittest.TestCase):
@@ -23,6 +37,7 @@ class TestCompiler(unittest.TestCase):
         self.compiler = Compiler()
         self.recompile = self.compiler.recompile
         self.test_class = type("TestClass", (), {})
+        Compiler.clear_cache()
 
     @for_examples(
         (lambda self: self.__private,       ('_TestClass__private', )),
@@ -53,6 +68,105 @@ class TestCompiler(unittest.TestCase):
         compiled = self.recompile(func, self.test_class, given_name)
         self.assertEqual(get_func_name(compiled), expected_name)
 
+    @for_examples(TestDummy.nested_access, TestDummy.lambda_access)
+    def test_supports_converting_attribute_names_in_nested_code(self, func):
+        self.test_class._TestClass__value = 42
+        compiled = self.recompile(func, self.test_class, "test")
+        self.assertEqual(compiled(self.test_class()), 42)
+
+    def test_shares_nested_code_between_traits_of_same_target(self):
+        first = self.recompile(TestDummy.lambda_access, self.test_class, "first")
+        second = self.recompile(TestDummy.lambda_access, self.test_class, "second")
+        nested = [const for const in first.__code__.co_consts if hasattr(const, "co_code")]
+        other = [const for const in second.__code__.co_consts if hasattr(const, "co_code")]
+        self.assertIs(nested[0], other[0])
+
+    def test_preserves_line_numbers(self):
+        compiled = self.recompile(TestDummy.public_func, self.test_class, "test")
+        original = TestDummy.public_func.__code__
+        self.assertEqual(compiled.__code__.co_firstlineno, original.co_firstlineno)
+        self.assertEqual(list(dis.findlinestarts(compiled.__code__)),
+                         list(dis.findlinestarts(original)))
+
+    def test_reuses_code_object_for_same_target_and_name(self):
+        first = self.recompile(TestDummy.public_func, self.test_class, "test")
+        second = self.recompile(TestDummy.public_func, self.test_class, "test")
+        self.assertIsNot(first, second)
+        self.assertIs(first.__code__, second.__code__)
+        self.assertEqual(Compiler.cache_info()[:2], (1, 1))
+
+    def test_recompiles_for_different_name_or_target(self):
+        other_class = type("OtherClass", (), {})
+        first = self.recompile(TestDummy.private_access, self.test_class, "test")
+        renamed = self.recompile(TestDummy.private_access, self.test_class, "other")
+        retargeted = self.recompile(TestDummy.private_access, other_class, "test")
+        self.assertIsNot(first.__code__, renamed.__code__)
+        self.assertIsNot(first.__code__, retargeted.__code__)
+        self.assertEqual(Compiler.cache_info()[:2], (0, 3))
+
+    def test_uses_original_code_when_nothing_to_mangle(self):
+        compiled = self.recompile(empty_func, self.test_class, "")
+        self.assertIs(compiled.__code__, empty_func.__code__)
+        self.assertEqual(Compiler.STATS["zero_copy"], 1)
+
+    def test_shares_renamed_code_between_targets_when_nothing_to_mangle(self):
+        other_class = type("OtherClass", (), {})
+        first = self.recompile(TestDummy.public_func, self.test_class, "test")
+        second = self.recompile(TestDummy.public_func, other_class, "test")
+        self.assertIs(first.__code__, second.__code__)
+        self.assertEqual(Compiler.STATS["zero_copy"], 2)
+        self.assertEqual(Compiler.STATS["recompiled"], 0)
+
+    def test_keeps_file_name_of_identical_functions(self):
+        source = "def method(self): return self.__value"
+        functions = []
+        for filename in ("a.py", "b.py"):
+            namespace = {}
+            exec(compile(source, filename, "exec"), namespace)
+            functions.append(namespace["method"])
+
+        first, second = (self.recompile(function, self.test_class, "test")
+                         for function in functions)
+        self.assertEqual(first.__code__.co_filename, "a.py")
+        self.assertEqual(second.__code__.co_filename, "b.py")
+
+    @for_examples(
+        (TestDummy.defaults, "defaults"),
+        (TestDummy.defaults, "renamed"),
+        (TestDummy.private_defaults, "renamed"))
+    def test_keeps_default_values(self, function, name):
+        compiled = self.recompile(function, self.test_class, name)
+        self.assertEqual(compiled.__defaults__, (1, ))
+        self.assertEqual(compiled.__kwdefaults__, {"other": 2})
+        self.assertIsNot(compiled.__kwdefaults__, function.__kwdefaults__)
+
+    def test_keeps_closure(self):
+        function = decorated(TestDummy.private_access)
+        compiled = self.recompile(function, self.test_class, "test")
+        self.assertIs(compiled.__closure__, function.__closure__)
+
+        instance = self.test_class()
+        instance._TestDummy__value = 42
+        self.assertEqual(compiled(instance), 42)
+
+    def test_cache_does_not_keep_target_alive(self):
+        target = type("Temporary", (), {})
+        reference = weakref.ref(target)
+        self.recompile(TestDummy.private_access, target, "test")
+        del target
+        gc.collect()
+        self.assertIsNone(reference())
+
+    def test_cache_size_is_bounded(self):
+        original_size = Compiler.cache_info().maxsize
+        Compiler.set_cache_size(1)
+        try:
+            self.recompile(TestDummy.public_func, self.test_class, "one")
+            self.recompile(TestDummy.public_func, self.test_class, "two")
+            self.assertEqual(Compiler.cache_info().currsize, 1)
+        finally:
+            Compiler.set_cache_size(original_size)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,186 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+import unittest
+
+from pytraits import add_traits, compile_traits
+from pytraits.core import TraitFactory
+from pytraits.core.composing.composer import BasicComposer, Property2Instance
+from pytraits.core.primitives.class_object import ClassObject
+from pytraits.core.primitives.instance_object import InstanceObject
+from pytraits.core.primitives.property_object import PropertyObject
+from pytraits.core.primitives.routine_object import MethodObject, StaticMethodObject
+
+
+class ExampleTrait:
+    def method(self):
+        pass
+
+    @staticmethod
+    def static():
+        pass
+
+    @property
+    def value(self):
+        pass
+
+
+class TestComposer(unittest.TestCase):
+    def setUp(self):
+        self.composer = TraitFactory["Composer"]
+        self.target = ClassObject(type("Example", (), {}))
+
+    def test_selects_composer_by_primitive_classes(self):
+        composer = self.composer(self.target, MethodObject(ExampleTrait.method))
+        self.assertIsInstance(composer, BasicComposer)
+
+        instance = InstanceObject(self.target.object())
+        composer = self.composer(instance, PropertyObject(ExampleTrait.value))
+        self.assertIsInstance(composer, Property2Instance)
+
+    def test_selects_composer_of_base_classes_for_subclasses(self):
+        class CustomStaticMethodObject(StaticMethodObject):
+            pass
+
+        source = CustomStaticMethodObject(ExampleTrait.__dict__["static"])
+        composer = self.composer(self.target, source)
+        self.assertIsInstance(composer, BasicComposer)
+        self.assertIs(composer.source, source)
+
+    def test_rejects_unsupported_combination(self):
+        source = ClassObject(ExampleTrait)
+        with self.assertRaisesRegex(TypeError, "class 'Example' and class 'ExampleTrait'.*"):
+            self.composer(self.target, source)
+
+    def test_rejects_objects_not_being_primitives(self):
+        with self.assertRaisesRegex(TypeError, ".*source to be TraitObject.*"):
+            self.composer(self.target, ExampleTrait.method)
+
+
+class ManyMembersTrait:
+    def first(self):
+        return 1
+
+    def second(self):
+        return 2
+
+    @property
+    def third(self):
+        return 3
+
+    @property
+    def fourth(self):
+        return 4
+
+
+class TestBulkComposing(unittest.TestCase):
+    def mutations(self):
+        return TraitFactory["Composer"].stats().get("class_mutations", 0)
+
+    def test_sets_each_member_to_class_once(self):
+        Example = type("Example", (), {})
+        before = self.mutations()
+        add_traits(Example, ManyMembersTrait)
+
+        self.assertEqual(self.mutations() - before, 4)
+        self.assertEqual((Example().first(), Example().second()), (1, 2))
+        self.assertEqual((Example().third, Example().fourth), (3, 4))
+
+    def test_skips_members_already_in_class(self):
+        Example = type("Example", (), {})
+        plan = compile_traits(ManyMembersTrait.first, ManyMembersTrait.third)
+        plan.apply(Example)
+        before = self.mutations()
+        plan.apply(Example)
+
+        self.assertEqual(self.mutations() - before, 0)
+
+    def test_forges_class_of_instance_with_all_properties(self):
+        Example = type("Example", (), {})
+        instance = Example()
+        before = self.mutations()
+        add_traits(instance, ManyMembersTrait)
+
+        self.assertEqual(self.mutations() - before, 0)
+        self.assertIs(type(instance).__bases__[0], Example)
+        self.assertEqual((instance.first(), instance.third, instance.fourth), (1, 3, 4))
+        self.assertFalse(hasattr(Example(), "third"))
+
+
+class LazyTrait:
+    def private(self):
+        return self.__value
+
+    @classmethod
+    def create(cls):
+        return cls.__name__
+
+    @staticmethod
+    def static():
+        return "static"
+
+
+class TestLazyComposing(unittest.TestCase):
+    def setUp(self):
+        class Example:
+            def __init__(self):
+                self.__value = 42
+        self.Example = Example
+
+    def lazy_bound(self):
+        return TraitFactory["Composer"].stats().get("lazy_bound", 0)
+
+    def test_binds_only_accessed_traits(self):
+        before = self.lazy_bound()
+        add_traits(self.Example, LazyTrait, lazy=True)
+        self.assertEqual(self.lazy_bound() - before, 0)
+
+        self.assertEqual(self.Example().private(), 42)
+        self.assertEqual(self.lazy_bound() - before, 1)
+        self.assertEqual(self.Example().private(), 42)
+        self.assertEqual(self.lazy_bound() - before, 1)
+
+    def test_binds_traits_like_composing_right_away(self):
+        Eager = type("Example", (self.Example, ), {})
+        add_traits(Eager, LazyTrait)
+        add_traits(self.Example, LazyTrait, lazy=True)
+
+        for name in ("private", "create", "static"):
+            self.assertEqual(type(getattr(self.Example, name)), type(getattr(Eager, name)))
+        self.assertEqual(self.Example.create(), "Example")
+        self.assertEqual(self.Example.static(), Eager.static())
+
+    def test_binds_trait_to_composed_class_when_accessed_from_subclass(self):
+        add_traits(self.Example, LazyTrait, lazy=True)
+        Subclass = type("Subclass", (self.Example, ), {})
+
+        self.assertEqual(Subclass().private(), 42)
+        self.assertEqual(type(self.Example.__dict__["private"]).__name__, "function")
+        self.assertNotIn("private", Subclass.__dict__)
+
+    def test_lazily_composed_class_can_be_used_as_trait(self):
+        add_traits(self.Example, LazyTrait, lazy=True)
+        Other = type("Other", (), {"_Other__value": 1})
+        add_traits(Other, self.Example)
+
+        self.assertEqual(Other().private(), 1)
+        self.assertEqual(Other.static(), "static")
+        self.assertNotIn("LazyTrait", [type(value).__name__ for value in vars(Other).values()])
+
+    def test_placeholder_moved_to_other_class_returns_trait(self):
+        add_traits(self.Example, LazyTrait, lazy=True)
+        Other = type("Other", (), {})
+        Other.private = self.Example.__dict__["private"]
+        Other._Example__value = 1
+
+        self.assertEqual(Other().private(), 1)
+        self.assertIs(Other.private, self.Example.__dict__["private"])
+
+    def test_composes_instances_right_away(self):
+        instance = self.Example()
+        add_traits(instance, LazyTrait.private, lazy=True)
+        self.assertIn("private", instance.__dict__)
+        self.assertEqual(instance.private(), 42)
+
+
+if __name__ == '__main__':
+    unittest.main()
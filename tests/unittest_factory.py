@@ -7,7 +7,7 @@ from pytraits.support.errors import (FactoryError,
                                      FactoryRegisterError,
                                      FactoryClassMissingError)
 
-from utils import for_examples
+from utils import for_examples, run_script
 
 
 class TestFactory1(Factory):
@@ -123,5 +123,65 @@ class TestFactory(unittest.TestCase):
         clazz = TestFactory1.register(TestClass7, TestClass8)
         self.assertEqual(None, clazz)
 
+
+class FrozenFactory(Factory):
+    pass
+
+
+class TestFrozenFactory(unittest.TestCase):
+    def setUp(self):
+        self.bound = {}
+        FrozenFactory.register(type('FrozenClass', (), {}))
+        FrozenFactory.bind(self.bind)
+
+    def tearDown(self):
+        FrozenFactory.reset()
+
+    def bind(self, factory):
+        self.bound = dict(factory.registry) if factory else {}
+
+    def test_binds_registered_classes_when_frozen(self):
+        self.assertEqual(self.bound, {})
+        FrozenFactory.freeze()
+        self.assertTrue(FrozenFactory().frozen)
+        self.assertEqual(self.bound, {'FrozenClass': FrozenFactory['FrozenClass']})
+
+    def test_binds_right_away_when_already_frozen(self):
+        FrozenFactory.freeze()
+        bound = []
+        FrozenFactory.bind(bound.append)
+        self.assertEqual(bound, [FrozenFactory()])
+
+    def test_complains_when_registering_to_frozen_factory(self):
+        FrozenFactory.freeze()
+        with self.assertRaisesRegex(FactoryRegisterError, '.*frozen.*'):
+            FrozenFactory.register(type('OtherClass', (), {}))
+
+    def test_registry_is_read_only(self):
+        with self.assertRaises(TypeError):
+            FrozenFactory().registry['OtherClass'] = None
+
+    def test_reset_releases_bound_classes(self):
+        FrozenFactory.freeze()
+        FrozenFactory.reset()
+        self.assertFalse(FrozenFactory().frozen)
+        self.assertEqual(self.bound, {})
+        FrozenFactory.register(type('OtherClass', (), {}))
+
+    def test_frozen_state_is_kept_for_each_factory(self):
+        FrozenFactory.freeze()
+        self.assertFalse(TestFactory1().frozen)
+
+    def test_reset_releases_objects_bound_by_pytraits_modules(self):
+        script = ("from pytraits.core import TraitFactory, TraitObject\n"
+                  "from pytraits import trait_composer\n"
+                  "from pytraits.core.composing import composer, plan, traits\n"
+                  "TraitFactory.reset()\n"
+                  "print(TraitObject.COMPILER, TraitObject.TRAIT_SOURCE, trait_composer.Traits,\n"
+                  "      composer.Compiler, plan.Composer, traits.Resolutions)")
+        output = run_script(script).stdout
+        self.assertEqual(output.decode().split(), ["None"] * 6)
+
+
 if __name__ == '__main__':
     unittest.main()
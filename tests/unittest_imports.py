@@ -0,0 +1,56 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+import unittest
+
+import pytraits
+
+from utils import run_script
+
+
+PUBLIC_NAMES = ["Singleton", "Factory", "combine_class", "extendable", "add_traits",
+                "type_safe", "type_converted", "setproperty", "compile_traits"]
+
+
+def run(script):
+    return run_script(script).stdout.decode().split()
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_importing_package_does_not_load_implementation(self):
+        loaded = run("import sys, pytraits\n"
+                     "print(*(name in sys.modules for name in\n"
+                     "        ('pytraits.core', 'pytraits.support.magic', 'inspect')))")
+        self.assertEqual(loaded, ["False", "False", "False"])
+
+    def test_support_names_do_not_load_core(self):
+        loaded = run("import sys, pytraits\n"
+                     "pytraits.Singleton, pytraits.type_safe\n"
+                     "print('pytraits.core' in sys.modules)")
+        self.assertEqual(loaded, ["False"])
+
+    def test_public_names_are_stable(self):
+        self.assertEqual(sorted(pytraits.__all__), sorted(PUBLIC_NAMES))
+        for name in PUBLIC_NAMES:
+            self.assertIsNotNone(getattr(pytraits, name))
+            self.assertIn(name, dir(pytraits))
+
+    def test_star_import_resolves_all_names(self):
+        names = run("from pytraits import *\n"
+                    "print(*sorted(name for name in dir() if not name.startswith('_')))")
+        self.assertEqual(names, sorted(PUBLIC_NAMES))
+
+    def test_submodules_are_imported_on_access(self):
+        modules = run("import pytraits\n"
+                      "print(pytraits.support.__name__, pytraits.core.__name__,\n"
+                      "      pytraits.support.utils.__name__)")
+        self.assertEqual(modules, ["pytraits.support", "pytraits.core", "pytraits.support.utils"])
+
+    def test_unknown_name_raises_attribute_error(self):
+        with self.assertRaises(AttributeError):
+            pytraits.does_not_exist
+        with self.assertRaises(AttributeError):
+            pytraits.support.does_not_exist
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -104,5 +104,51 @@ class TestInspector(unittest.TestCase):
         self.assertEqual(self.inspector.typenames[0], 'data')
         self.assertEqual(self.inspector.inspect(2), 'data')
 
+    def test_objects_of_same_type_are_identified_by_their_state(self):
+        for _ in range(2):
+            self.assertEqual(self.inspect(ExampleClass.test_method), 'function')
+            self.assertEqual(self.inspect(ExampleClass.test_staticmethod), 'staticmethod')
+            self.assertEqual(self.inspect(ExampleClass), 'class')
+            self.assertEqual(self.inspect(MetaClass), 'metaclass')
+            self.assertEqual(self.inspect(int), 'builtin')
+
+    def test_new_typecheck_is_used_for_already_inspected_types(self):
+        self.assertEqual(self.inspect(2), 'data')
+        self.inspector.add_typecheck('two', lambda object: object == 2)
+        self.assertEqual(self.inspect(2), 'two')
+        self.assertEqual(self.inspect(3), 'data')
+        self.inspector.del_typecheck('two')
+        self.assertEqual(self.inspect(2), 'data')
+
+    def test_new_hook_is_used_for_already_inspected_types(self):
+        self.assertEqual(self.inspect(2), 'data')
+        self.inspector.add_hook('data', lambda object: 'hooked')
+        self.assertEqual(self.inspect(2), 'hooked')
+        self.inspector.del_hook('data')
+        self.assertEqual(self.inspect(2), 'data')
+
+    def test_inspects_many_objects_in_given_order(self):
+        objects = [ExampleClass.test_method, 1, ExampleClass,
+                   ExampleClass.test_staticmethod, "test", MetaClass]
+        self.assertEqual(self.inspector.inspect_many(objects),
+                         [self.inspect(object) for object in objects])
+
+    def test_inspects_many_objects_from_iterable_using_hooks(self):
+        self.inspector.add_hook('data', lambda object: [object])
+        self.assertEqual(self.inspector.inspect_many(iter([1, "a", None, 3])),
+                         [[1], ["a"], [None], [3]])
+
+    def test_typecheck_depending_on_type_is_run_once_per_type(self):
+        calls = []
+
+        def check(object):
+            calls.append(object)
+            return isinstance(object, float)
+
+        self.inspector.add_typecheck('float', check, by_type=True)
+        self.assertEqual([self.inspect(value) for value in (1.0, 2.0, 3)],
+                         ['float', 'float', 'data'])
+        self.assertEqual(calls, [1.0, 3])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,106 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+import gc
+import unittest
+import weakref
+
+from pytraits import add_traits, setproperty
+from pytraits.core.primitives.instance_object import InstanceObject
+
+
+class ExampleTrait:
+    @property
+    def first(self):
+        return 1
+
+    @property
+    def second(self):
+        return 2
+
+
+class Example:
+    pass
+
+
+def getter(self):
+    return 42
+
+
+class TestForging(unittest.TestCase):
+    def test_forging_is_done_only_once(self):
+        instance = Example()
+        add_traits(instance, ExampleTrait.first)
+        forged = type(instance)
+        add_traits(instance, ExampleTrait.second)
+        self.assertIs(type(instance), forged)
+        self.assertEqual(type(instance).__mro__, (forged, Example, object))
+        self.assertEqual((instance.first, instance.second), (1, 2))
+        self.assertFalse(hasattr(Example(), "first"))
+
+    def test_forged_classes_are_not_shared(self):
+        one, other = Example(), Example()
+        add_traits(one, ExampleTrait.first)
+        add_traits(other, ExampleTrait.first)
+        self.assertIsNot(type(one), type(other))
+
+    def test_subclass_of_forged_class_is_forged_again(self):
+        instance = Example()
+        add_traits(instance, ExampleTrait.first)
+        Subclass = type("Subclass", (type(instance), ), {})
+        other = Subclass()
+        add_traits(other, ExampleTrait.second)
+        self.assertIsNot(type(other), Subclass)
+        self.assertFalse(hasattr(Subclass(), "second"))
+
+
+class TestInterning(unittest.TestCase):
+    def setUp(self):
+        InstanceObject.INTERN_FORGED = True
+
+    def tearDown(self):
+        InstanceObject.INTERN_FORGED = False
+
+    def test_instances_with_same_traits_share_forged_class(self):
+        one, other = Example(), Example()
+        add_traits(one, ExampleTrait.first)
+        add_traits(other, ExampleTrait.first)
+        self.assertIs(type(one), type(other))
+        self.assertEqual(one.first, 1)
+        self.assertFalse(hasattr(Example(), "first"))
+
+    def test_instances_with_different_traits_have_own_classes(self):
+        one, other = Example(), Example()
+        add_traits(one, ExampleTrait.first)
+        add_traits(other, ExampleTrait.second)
+        self.assertIsNot(type(one), type(other))
+        self.assertFalse(hasattr(one, "second"))
+        self.assertFalse(hasattr(other, "first"))
+
+    def test_instances_with_same_property_functions_share_forged_class(self):
+        one, other = Example(), Example()
+        setproperty(one, getter, name="value")
+        setproperty(other, getter, name="value")
+        self.assertIs(type(one), type(other))
+        self.assertEqual(one.value, 42)
+
+    def test_composing_more_traits_keeps_hierarchy_flat(self):
+        one, other = Example(), Example()
+        add_traits(one, ExampleTrait.first)
+        add_traits(one, ExampleTrait.second)
+        add_traits(other, ExampleTrait.second)
+        add_traits(other, ExampleTrait.first)
+        self.assertIs(type(one), type(other))
+        self.assertEqual(type(one).__bases__, (Example, ))
+        self.assertEqual((one.first, one.second), (1, 2))
+
+    def test_forged_class_is_released_with_last_instance(self):
+        instance = Example()
+        add_traits(instance, ExampleTrait.first)
+        forged = weakref.ref(type(instance))
+        del instance
+        gc.collect()
+        self.assertIsNone(forged())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+import unittest
+
+from pytraits import compile_traits
+from pytraits.core.composing.compiler import Compiler
+
+
+class ExampleTrait:
+    def value(self):
+        return self.__value
+
+    def public(self):
+        return 42
+
+
+class TestCompositionPlan(unittest.TestCase):
+    def setUp(self):
+        Compiler.clear_cache()
+
+    def create_class(self):
+        class Example:
+            def __init__(self):
+                self.__value = 1
+        return Example
+
+    def test_compiles_once_for_targets_of_same_kind(self):
+        plan = compile_traits(ExampleTrait)
+        classes = [self.create_class() for _ in range(3)]
+        for clazz in classes:
+            plan.apply(clazz)
+
+        self.assertEqual(Compiler.STATS["recompiled"], 1)
+        self.assertEqual(Compiler.STATS["zero_copy"], 1)
+        for clazz in classes:
+            self.assertEqual(clazz().value(), 1)
+            self.assertEqual(clazz().public(), 42)
+
+    def test_compiles_again_for_different_kind_of_target(self):
+        plan = compile_traits(ExampleTrait)
+        plan.apply(self.create_class())
+        plan.apply(self.create_class()())
+        self.assertEqual(Compiler.STATS["recompiled"], 2)
+
+    def test_applies_resolutions(self):
+        plan = compile_traits(ExampleTrait, public="renamed")
+        instance = self.create_class()()
+        plan.apply(instance)
+        self.assertEqual(instance.renamed(), 42)
+        self.assertFalse(hasattr(instance, "public"))
+
+
+if __name__ == '__main__':
+    unittest.main()
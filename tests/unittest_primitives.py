@@ -0,0 +1,84 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+import os
+import tempfile
+import textwrap
+import unittest
+
+from pytraits.core import TraitObject
+from pytraits.core.primitives import PRIMITIVES
+from pytraits.core.primitives.class_object import ClassObject
+from pytraits.core.primitives.property_object import PropertyObject
+from pytraits.core.primitives.routine_object import MethodObject
+from utils import run_script
+
+
+def all_primitives(clazz=TraitObject):
+    for subclass in clazz.__subclasses__():
+        if subclass.__module__.startswith("pytraits."):
+            yield subclass
+            yield from all_primitives(subclass)
+
+
+class ExampleTrait:
+    def method(self):
+        pass
+
+    @property
+    def value(self):
+        return 42
+
+
+class TestPrimitives(unittest.TestCase):
+    def test_primitives_do_not_have_instance_dictionary(self):
+        primitives = list(all_primitives())
+        self.assertIn(PropertyObject, primitives)
+
+        for primitive in primitives:
+            self.assertIn("__slots__", primitive.__dict__, primitive.__name__)
+        self.assertFalse(hasattr(PropertyObject(ExampleTrait.value), "__dict__"))
+
+    def test_primitives_share_compiler(self):
+        method = MethodObject(ExampleTrait.method)
+        clazz = ClassObject(ExampleTrait)
+        self.assertIs(method._compiler, clazz._compiler)
+
+    def test_property_keeps_its_name(self):
+        value = PropertyObject(ExampleTrait.value, "renamed")
+        self.assertEqual(value.name, "renamed")
+        self.assertEqual(PropertyObject(ExampleTrait.value).name, "value")
+
+
+PLUGIN = textwrap.dedent("""
+    from pytraits.core.primitives.trait_object import TraitObject
+
+    class GeneratorObject(TraitObject):
+        INSPECTORS = ('source', )
+
+        @classmethod
+        def hook_into(cls, inspector):
+            inspector.add_hook('generator', cls)
+""")
+
+
+class TestPrimitiveRegistry(unittest.TestCase):
+    def test_registry_contains_all_hooked_primitives(self):
+        hooked = [primitive for primitive in all_primitives()
+                  if "INSPECTORS" in primitive.__dict__ or "hook_into" in primitive.__dict__]
+        self.assertEqual(set(hooked), set(PRIMITIVES))
+
+    def test_scans_plugin_packages_given_in_environment(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, "generator_plugin.py"), "w") as plugin:
+                plugin.write(PLUGIN)
+
+            script = ("from pytraits.core import TraitFactory\n"
+                      "generator = (item for item in ())\n"
+                      "print(type(TraitFactory['TraitSourceInspector'](generator)).__name__)")
+            output = run_script(script, [directory], PYTRAITS_PRIMITIVES="generator_plugin").stdout
+
+        self.assertEqual(output.decode().strip(), "GeneratorObject")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
 #!/usr/bin/python -tt
 # -*- coding: utf-8 -*-
+import threading
+import time
 import unittest
 
 from pytraits import Singleton
@@ -58,5 +60,48 @@ class TestSingleton(unittest.TestCase):
             no_write.begin = 1
         self.assertEqual(no_write.begin, 3)
 
+    def test_subclass_gets_own_instance(self):
+        class Parent(metaclass=Singleton):
+            def __init__(self):
+                self.name = type(self).__name__
+
+        class Child(Parent):
+            pass
+
+        parent = Parent()
+        child = Child()
+
+        self.assertIsNot(parent, child)
+        self.assertEqual((parent.name, child.name), ("Parent", "Child"))
+        self.assertIs(Child(), child)
+        with self.assertRaises(SingletonError):
+            child.name = "other"
+
+    def test_creates_only_one_instance_in_multiple_threads(self):
+        created = []
+
+        class Slow(metaclass=Singleton):
+            def __init__(self):
+                created.append(self)
+                time.sleep(0.01)
+
+        barrier = threading.Barrier(8)
+        results = []
+
+        def create():
+            barrier.wait()
+            results.append(Slow())
+
+        threads = [threading.Thread(target=create) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(created), 1)
+        self.assertEqual(len(results), 8)
+        for result in results:
+            self.assertIs(result, created[0])
+
 if __name__ == '__main__':
     unittest.main()
@@ -2,8 +2,28 @@
 # -*- coding: utf-8 -*-
 import unittest
 
-from pytraits.support.errors import FirstTraitArgumentError, TraitArgumentTypeError
+from pytraits.support.errors import (FirstTraitArgumentError, TraitArgumentTypeError,
+                                     TraitConflictError)
+from pytraits import add_traits, combine_class, compile_traits
+from pytraits.core import TraitFactory
 from pytraits.core.composing.traits import Traits
+from pytraits.core.composing.resolutions import Resolutions
+
+
+class FirstTrait:
+    def shared(self):
+        return "first"
+
+    def first(self):
+        return 1
+
+
+class SecondTrait:
+    def shared(self):
+        return "second"
+
+    def second(self):
+        return 2
 
 
 class TestTraits(unittest.TestCase):
@@ -46,5 +66,95 @@ class TestTraits(unittest.TestCase):
         traits = Traits(({}, ""))
         self.assertTrue(traits.needs_preprocessing())
 
+
+class TestConflicts(unittest.TestCase):
+    def setUp(self):
+        class Example:
+            def existing(self):
+                return "existing"
+        self.Example = Example
+
+    def compose(self, *traits, policy=None, **resolutions):
+        target = TraitFactory["TraitTargetInspector"](self.Example)
+        return Traits.create(traits).compose(target, resolutions, policy)
+
+    def test_last_trait_wins_by_default(self):
+        names = self.compose(FirstTrait, SecondTrait)
+        self.assertEqual(self.Example().shared(), "second")
+        self.assertEqual(names["shared"], "SecondTrait.shared")
+        self.assertEqual(sorted(names), ["first", "second", "shared"])
+
+    def test_first_trait_wins_with_first_policy(self):
+        names = self.compose(FirstTrait, SecondTrait, policy=Resolutions.FIRST)
+        self.assertEqual(self.Example().shared(), "first")
+        self.assertEqual(names["shared"], "FirstTrait.shared")
+        self.assertEqual(self.Example().second(), 2)
+
+    def test_target_wins_with_first_policy(self):
+        self.compose(FirstTrait.shared, policy=Resolutions.FIRST, shared="existing")
+        self.assertEqual(self.Example().existing(), "existing")
+
+    def test_raises_error_for_conflicting_traits(self):
+        with self.assertRaisesRegex(TraitConflictError, ".*'shared'.*'FirstTrait.shared'"):
+            self.compose(FirstTrait, SecondTrait, policy=Resolutions.ERROR)
+        self.assertFalse(hasattr(self.Example, "first"))
+
+    def test_raises_error_for_conflict_with_target(self):
+        with self.assertRaisesRegex(TraitConflictError, ".*already used by target"):
+            self.compose(FirstTrait.first, policy=Resolutions.ERROR, first="existing")
+
+    def test_raises_error_for_conflict_with_inherited_member(self):
+        Subclass = type("Subclass", (self.Example, ), {})
+        with self.assertRaisesRegex(TraitConflictError, ".*already used by target"):
+            add_traits(Subclass, FirstTrait.first, policy=Resolutions.ERROR, first="existing")
+        self.assertNotIn("existing", Subclass.__dict__)
+
+    def test_raises_error_for_conflict_with_instance_member(self):
+        instance = self.Example()
+        instance.value = 1
+        with self.assertRaises(TraitConflictError):
+            add_traits(instance, FirstTrait.first, policy=Resolutions.ERROR, first="value")
+
+    def test_does_not_compile_lazy_members_of_target(self):
+        add_traits(self.Example, SecondTrait, lazy=True)
+        with self.assertRaises(TraitConflictError):
+            add_traits(self.Example, FirstTrait, policy=Resolutions.ERROR)
+        self.assertEqual(type(self.Example.__dict__["second"]).__name__, "LazyTrait")
+
+    def test_rejects_unknown_policy(self):
+        with self.assertRaisesRegex(ValueError, "Unknown policy 'fist'"):
+            add_traits(self.Example, FirstTrait, policy="fist")
+
+    def test_resolves_conflict_by_renaming(self):
+        class ExistingTrait:
+            def existing(self):
+                return "trait"
+
+        names = self.compose(ExistingTrait, policy=Resolutions.ERROR, existing="renamed")
+        self.assertEqual(self.Example().existing(), "existing")
+        self.assertEqual(self.Example().renamed(), "trait")
+        self.assertEqual(list(names), ["renamed"])
+
+    def test_ignores_trait_resolved_to_none(self):
+        names = self.compose(FirstTrait, shared=None)
+        self.assertFalse(hasattr(self.Example, "shared"))
+        self.assertEqual(list(names), ["first"])
+
+    def test_add_traits_uses_policy_and_returns_names(self):
+        names = add_traits(self.Example, FirstTrait, SecondTrait, policy=Resolutions.FIRST)
+        self.assertEqual(self.Example().shared(), "first")
+        self.assertEqual(names["shared"], "FirstTrait.shared")
+        self.assertFalse(hasattr(self.Example, "policy"))
+
+    def test_combine_class_uses_policy(self):
+        with self.assertRaises(TraitConflictError):
+            combine_class("Combination", FirstTrait, SecondTrait, policy=Resolutions.ERROR)
+
+    def test_compiled_traits_use_policy(self):
+        plan = compile_traits(FirstTrait, SecondTrait, policy=Resolutions.FIRST)
+        plan.apply(self.Example)
+        self.assertEqual(self.Example().shared(), "first")
+
+
 if __name__ == '__main__':
     unittest.main()
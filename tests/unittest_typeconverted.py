@@ -1,8 +1,13 @@
 #!/usr/bin/python -tt
 # -*- coding: utf-8 -*-
+import datetime
+import decimal
+import enum
 import unittest
 
 from pytraits import type_converted
+from pytraits.support import magic
+from pytraits.support.magic import register_converter
 from pytraits.support.errors import TypeConversionError
 
 
@@ -109,5 +114,93 @@ class TestTypeConverted(unittest.TestCase):
         with self.assertRaisesRegex(TypeError, ".*takes from 0 to 1 positional.*"):
             self.assertEqual(converted(True, 52), 52)
 
+    def test_converts_arguments_given_as_keywords(self):
+        @type_converted
+        def converted(existing: int, *, flag: bool=False):
+            return existing, flag
+
+        self.assertEqual(converted(existing="1", flag="true"), (1, True))
+        self.assertEqual(converted("2"), (2, False))
+
+    def test_keeps_extra_positional_arguments(self):
+        @type_converted
+        def converted(existing: int, *remainder):
+            return existing, remainder
+
+        self.assertEqual(converted("1", "2", "3"), (1, ("2", "3")))
+
+    def test_converts_values_with_registered_converters(self):
+        class Color(enum.Enum):
+            RED = 1
+            BLUE = 2
+
+        @type_converted
+        def converted(color: Color, price: decimal.Decimal, day: datetime.date):
+            return color, price, day
+
+        self.assertEqual(converted("BLUE", 0.1, "2015-06-01"),
+                         (Color.BLUE, decimal.Decimal("0.1"), datetime.date(2015, 6, 1)))
+        self.assertEqual(converted(1, "2.50", datetime.date(2015, 6, 1))[:2],
+                         (Color.RED, decimal.Decimal("2.50")))
+
+    def test_passes_subclass_of_date_as_is(self):
+        @type_converted
+        def converted(day: datetime.date):
+            return day
+
+        moment = datetime.datetime(2015, 6, 1, 12, 30)
+        self.assertIs(converted(moment), moment)
+
+    def test_shows_conversion_error_when_dates_can_not_be_parsed(self):
+        @type_converted
+        def converted(day: datetime.date):
+            return day
+
+        original, magic._PARSES_ISO_FORMAT = magic._PARSES_ISO_FORMAT, False
+        try:
+            with self.assertRaises(TypeConversionError):
+                converted("2015-06-01")
+        finally:
+            magic._PARSES_ISO_FORMAT = original
+
+    def test_shows_conversion_error_for_invalid_values(self):
+        @type_converted
+        def converted(existing: int, price: decimal.Decimal):
+            pass
+
+        with self.assertRaisesRegex(TypeConversionError, ".*'existing'.*\n.*'price'"):
+            converted("one", "two")
+
+    def test_passes_values_of_exact_type_without_converting(self):
+        class Value(int):
+            def __new__(cls, value):
+                raise AssertionError("Value should not have been converted!")
+
+        value = int.__new__(Value, 12)
+
+        @type_converted
+        def converted(existing: Value):
+            return existing
+
+        self.assertIs(converted(value), value)
+
+    def test_uses_converter_registered_before_decorating(self):
+        class Celsius(float):
+            pass
+
+        converters = dict(magic._CONVERTERS)
+        register_converter(Celsius, lambda target, value: target(value.rstrip("C")))
+        try:
+            @type_converted
+            def converted(temperature: Celsius):
+                return temperature
+        finally:
+            magic._CONVERTERS.clear()
+            magic._CONVERTERS.update(converters)
+
+        self.assertEqual(converted("21.5C"), Celsius(21.5))
+        self.assertNotIn(Celsius, magic._CONVERTERS)
+
+
 if __name__ == '__main__':
     unittest.main()
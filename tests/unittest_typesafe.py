@@ -1,8 +1,11 @@
 #!/usr/bin/python -tt
 # -*- coding: utf-8 -*-
+import threading
 import unittest
 
-from pytraits import type_safe
+from pytraits import type_safe, type_converted
+from pytraits.support import configure_checks
+from utils import run_script
 
 
 class TestTypeSafe(unittest.TestCase):
@@ -108,6 +111,109 @@ class TestTypeSafe(unittest.TestCase):
         with self.assertRaisesRegex(TypeError, ".*takes from 0 to 1 positional.*"):
             self.assertEqual(checked(True, 52), 52)
 
+    def test_checks_arguments_given_as_keywords(self):
+        @type_safe
+        def checked(existing: bool, other: int):
+            return existing, other
+
+        self.assertEqual(checked(other=1, existing=True), (True, 1))
+        with self.assertRaisesRegex(TypeError, "parameter 'other' had value '1'"):
+            checked(True, other="1")
+
+    def test_checks_keyword_only_arguments(self):
+        @type_safe
+        def checked(existing, *, flag: bool=False):
+            return flag
+
+        self.assertEqual(checked(1), False)
+        self.assertEqual(checked(1, flag=True), True)
+        with self.assertRaisesRegex(TypeError, "parameter 'flag' had value 'yes'"):
+            checked(1, flag="yes")
+
+    def test_does_not_check_default_values(self):
+        @type_safe
+        def checked(existing: int, missing_with_default: int=None):
+            return missing_with_default
+
+        self.assertEqual(checked(1), None)
+        with self.assertRaisesRegex(TypeError, "parameter 'missing_with_default'"):
+            checked(1, "2")
+
+    def test_returns_original_function_when_checks_are_disabled(self):
+        def unchecked(existing: bool):
+            return existing
+
+        configure_checks(enabled=False)
+        try:
+            self.assertIs(type_safe(unchecked), unchecked)
+        finally:
+            configure_checks(enabled=True)
+
+    def test_converts_values_when_checks_are_disabled(self):
+        def converted(flag: bool, number: int):
+            return flag, number
+
+        configure_checks(enabled=False)
+        try:
+            converted = type_converted(converted)
+        finally:
+            configure_checks(enabled=True)
+
+        self.assertEqual(converted("false", "3"), (False, 3))
+
+    def test_rejects_invalid_sampling_from_environment(self):
+        process = run_script("import pytraits.support.magic", check=False,
+                             PYTRAITS_CHECK_SAMPLING="often")
+        self.assertNotEqual(process.returncode, 0)
+        self.assertIn(b"PYTRAITS_CHECK_SAMPLING must be a positive integer, got 'often'",
+                      process.stderr)
+
+    def test_checks_only_sampled_calls(self):
+        configure_checks(sampling=3)
+        try:
+            @type_safe
+            def checked(existing: bool):
+                return existing
+        finally:
+            configure_checks(sampling=1)
+
+        self.assertEqual(checked(1), 1)
+        self.assertEqual(checked(2), 2)
+        with self.assertRaises(TypeError):
+            checked(3)
+        self.assertEqual(checked(4), 4)
+
+    def test_binds_method_to_calling_instance_in_multiple_threads(self):
+        class Checked:
+            def __init__(self, identity):
+                self.identity = identity
+
+            @type_safe
+            def check(self, value: int):
+                return self.identity, value
+
+        failures = []
+
+        def worker(identity):
+            instance = Checked(identity)
+            for value in range(2000):
+                if instance.check(value) != (identity, value):
+                    failures.append(identity)
+                try:
+                    instance.check(str(identity))
+                except TypeError as error:
+                    if str(error).count("parameter") != 1 or \
+                       "'{}'".format(identity) not in str(error):
+                        failures.append(identity)
+
+        threads = [threading.Thread(target=worker, args=(i, )) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(failures, [])
+
 
 if __name__ == '__main__':
     unittest.main()
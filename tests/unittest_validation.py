@@ -0,0 +1,58 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+import unittest
+
+from pytraits.support.magic import validation, Interval
+from pytraits.support.errors import ArgumentValueError
+
+
+class TestValidation(unittest.TestCase):
+    def test_accepts_single_allowed_value(self):
+        @validation
+        def validated(existing: "only"):
+            return existing
+
+        self.assertEqual(validated("only"), "only")
+        with self.assertRaises(ArgumentValueError):
+            validated("other")
+
+    def test_accepts_unhashable_values(self):
+        @validation
+        def validated(existing: ([1], [2]), other: (1, 2)):
+            return existing, other
+
+        self.assertEqual(validated([2], 1), ([2], 1))
+        with self.assertRaisesRegex(ArgumentValueError, ".*'other' as '\\[1\\]'.*"):
+            validated([1], [1])
+
+    def test_checks_keyword_arguments(self):
+        @validation
+        def validated(existing: tuple(range(1000)), *, flag: (True, False)=False):
+            return existing, flag
+
+        self.assertEqual(validated(existing=999, flag=True), (999, True))
+        with self.assertRaisesRegex(ArgumentValueError, ".*'existing' as '1000'.*"):
+            validated(existing=1000)
+
+    def test_does_not_accept_non_integers_in_range(self):
+        @validation
+        def validated(existing: range(10)):
+            return existing
+
+        self.assertEqual(validated(9), 9)
+        for value in (2.5, "2", None, 10):
+            with self.assertRaises(ArgumentValueError):
+                validated(value)
+
+    def test_checks_limits_of_interval(self):
+        @validation
+        def validated(closed: Interval(0, 1), opened: Interval(0, 1, closed=False)):
+            return closed, opened
+
+        self.assertEqual(validated(1, 0.5), (1, 0.5))
+        with self.assertRaisesRegex(ArgumentValueError, ".*'opened' as '1'.*"):
+            validated(0, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
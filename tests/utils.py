@@ -1,8 +1,12 @@
 #!/usr/bin/python -tt
 # -*- coding: utf-8 -*-
 
+import os
+import subprocess
 import sys
 
+import pytraits
+
 
 def for_examples(*parameters):
     """
@@ -24,3 +28,21 @@ def for_examples(*parameters):
             frame.f_locals[name_for_parameter] = method_for_parameter
         return None
     return decorator
+
+
+def run_script(script, paths=(), check=True, **environment):
+    """ Runs script in fresh interpreter, where nothing is imported yet.
+
+    Args:
+        script: Python source to run.
+        paths: Additional directories for PYTHONPATH, pytraits is always found.
+        check: Raise CalledProcessError, if the script fails.
+        environment: Additional environment variables.
+
+    Returns:
+        CompletedProcess with captured stdout and stderr.
+    """
+    paths = list(paths) + [os.path.dirname(os.path.dirname(pytraits.__file__))]
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join(paths), **environment)
+    return subprocess.run([sys.executable, "-c", script], env=environment, check=check,
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE)